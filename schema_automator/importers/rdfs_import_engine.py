@@ -1,6 +1,7 @@
 import logging
-from typing import Dict, List, Any
-from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, FrozenSet, Iterator, List, Any, Optional, Set, Tuple
 
 from linkml.utils.schema_builder import SchemaBuilder
 from linkml_runtime import SchemaView
@@ -9,6 +10,7 @@ from linkml_runtime.linkml_model import (
     SlotDefinition,
     ClassDefinition,
 )
+from linkml_runtime.linkml_model.meta import AnonymousSlotExpression
 from funowl.converters.functional_converter import to_python
 from funowl import *
 
@@ -17,6 +19,9 @@ from dataclasses import dataclass, field
 from linkml_runtime.utils.formatutils import underscore
 from linkml_runtime.utils.introspection import package_schemaview
 from rdflib import Graph, RDF, OWL, URIRef, RDFS, SKOS, SDO, Namespace
+from rdflib.namespace import split_uri
+from rdflib.term import Literal as RDFLiteral
+from rdflib.plugins.stores.memory import Memory
 from schema_automator.importers.import_engine import ImportEngine
 from schema_automator.utils.schemautils import write_schema
 
@@ -26,7 +31,7 @@ HTTP_SDO = Namespace("http://schema.org/")
 DEFAULT_METAMODEL_MAPPINGS = {
     "is_a": [RDFS.subClassOf, SKOS.broader],
     "domain_of": [HTTP_SDO.domainIncludes, SDO.domainIncludes],
-    "rangeIncludes": [HTTP_SDO.rangeIncludes, SDO.rangeIncludes],
+    "range": [HTTP_SDO.rangeIncludes, SDO.rangeIncludes],
     "exact_mappings": [OWL.sameAs, HTTP_SDO.sameAs],
     ClassDefinition.__name__: [RDFS.Class, OWL.Class, SKOS.Concept],
     SlotDefinition.__name__: [
@@ -38,6 +43,87 @@ DEFAULT_METAMODEL_MAPPINGS = {
 }
 
 
+@lru_cache(maxsize=1)
+def _get_metamodel_sv() -> SchemaView:
+    """
+    Loads the LinkML metamodel once and shares it between engine instances.
+
+    :return:
+    """
+    return package_schemaview("linkml_runtime.linkml_model.meta")
+
+
+@lru_cache(maxsize=None)
+def _metamodel_induced_slot_names(class_name: str) -> Tuple[str, ...]:
+    return tuple(s.name for s in _get_metamodel_sv().class_induced_slots(class_name))
+
+
+@lru_cache(maxsize=1)
+def _metamodel_element_mappings() -> Tuple[Tuple[str, Tuple[URIRef, ...]], ...]:
+    """
+    Collects the expanded mappings of every metamodel element in a single pass.
+
+    :return: (element name, mapping URIs) pairs, in metamodel element order
+    """
+    sv = _get_metamodel_sv()
+    return tuple(
+        (
+            e.name,
+            tuple(URIRef(m) for ms in sv.get_mappings(e.name, expand=True).values() for m in ms),
+        )
+        for e in sv.all_elements().values()
+    )
+
+
+@lru_cache(maxsize=1)
+def _metamodel_type_names() -> Tuple[str, ...]:
+    return tuple(_get_metamodel_sv().all_types())
+
+
+def _graph_triples(g: Graph) -> Iterator[Tuple[Any, Any, Any]]:
+    """
+    Iterates over all triples in a graph.
+
+    For the default in-memory store holding only this graph, this walks the
+    subject index directly, bypassing the per-triple context checks done by
+    Graph.triples. The index spans every context in the store, so other stores,
+    or stores with further contexts (e.g. N3 quoted formulas), fall back to
+    iterating the graph.
+
+    :param g:
+    :return:
+    """
+    spo = None
+    if isinstance(g.store, Memory) and all(
+        c.identifier == g.identifier for c in g.store.contexts()
+    ):
+        spo = getattr(g.store, "_Memory__spo", None)
+    if spo is None:
+        yield from g
+        return
+    for s, pos in spo.items():
+        for p, objs in pos.items():
+            for o in objs:
+                yield s, p, o
+
+
+def _uriref_to_value(engine: "RdfsImportEngine", obj: URIRef, is_uri_range: bool) -> str:
+    if is_uri_range:
+        return str(obj)
+    return engine.iri_to_name(obj)
+
+
+def _literal_to_value(engine: "RdfsImportEngine", obj: RDFLiteral, is_uri_range: bool) -> Any:
+    return obj.value
+
+
+# keyed on the exact type of a triple object
+_OBJECT_CONVERTERS = {
+    URIRef: _uriref_to_value,
+    RDFLiteral: _literal_to_value,
+}
+
+
 @dataclass
 class RdfsImportEngine(ImportEngine):
     """
@@ -52,34 +138,53 @@ class RdfsImportEngine(ImportEngine):
     metamodel = None
     metamodel_schemaview: SchemaView = None
     classdef_slots: List[str] = None
+    _pred_cache: Dict[str, Dict[URIRef, Tuple[Optional[str], bool, bool]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _slot_metaclass_iris: FrozenSet[URIRef] = field(default=None, init=False, repr=False, compare=False)
+    _class_metaclass_iris: FrozenSet[URIRef] = field(default=None, init=False, repr=False, compare=False)
+    _domain_range_preds: FrozenSet[URIRef] = field(default=None, init=False, repr=False, compare=False)
+    _name_cache: Dict[URIRef, str] = field(default=None, init=False, repr=False, compare=False)
+    _mappable_preds: FrozenSet[URIRef] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        sv = package_schemaview("linkml_runtime.linkml_model.meta")
+        sv = _get_metamodel_sv()
         self.metamodel_schemaview = sv
         self.metamodel = sv
-        self.metamodel_mappings = defaultdict(list)
-        self.reverse_metamodel_mappings = defaultdict(list)
+        self.metamodel_mappings = {}
+        self.reverse_metamodel_mappings = {}
         for k, vs in DEFAULT_METAMODEL_MAPPINGS.items():
-            self.metamodel_mappings[k].extend(vs)
+            self.metamodel_mappings.setdefault(k, []).extend(vs)
             for v in vs:
-                self.reverse_metamodel_mappings[v].append(k)
+                self.reverse_metamodel_mappings.setdefault(v, []).append(k)
         if self.initial_metamodel_mappings:
             for k, vs in self.initial_metamodel_mappings.items():
                 if not isinstance(vs, list):
                     vs = [vs]
-                self.metamodel_mappings[k].extend(vs)
+                vs = [v if isinstance(v, URIRef) else URIRef(v) for v in vs]
+                self.metamodel_mappings.setdefault(k, []).extend(vs)
                 for v in vs:
-                    self.reverse_metamodel_mappings[URIRef(v)].append(k)
+                    self.reverse_metamodel_mappings.setdefault(v, []).append(k)
                     logging.info(f"Adding mapping {k} -> {v}")
-        for e in sv.all_elements().values():
-            mappings = []
-            for ms in sv.get_mappings(e.name, expand=True).values():
-                for m in ms:
-                    uri = URIRef(m)
-                    mappings.append(uri)
-                    self.reverse_metamodel_mappings[uri].append(e.name)
-            self.metamodel_mappings[e.name] = mappings
-        self.defclass_slots = [s.name for s in sv.class_induced_slots(ClassDefinition.class_name)]
+        for element_name, mappings in _metamodel_element_mappings():
+            for uri in mappings:
+                self.reverse_metamodel_mappings.setdefault(uri, []).append(element_name)
+            # extend rather than replace, so the default mappings for metaslots
+            # such as domain_of and range are kept
+            self.metamodel_mappings.setdefault(element_name, []).extend(mappings)
+        self.defclass_slots = list(_metamodel_induced_slot_names(ClassDefinition.class_name))
+        # properties additionally keep their domains and ranges; other slot
+        # metaslots (e.g. subproperty_of, inverse) reference slots that may not
+        # be part of the generated schema
+        self.slotdef_slots = self.defclass_slots + ["domain_of", "range"]
+        self._pred_cache = {"class": {}, "slot": {}}
+        self._name_cache = {}
+        self._slot_metaclass_iris = frozenset(self._rdfs_metamodel_iri(SlotDefinition.__name__))
+        self._class_metaclass_iris = frozenset(self._rdfs_metamodel_iri(ClassDefinition.__name__))
+        self._domain_range_preds = frozenset(
+            self.metamodel_mappings["domain_of"] + self.metamodel_mappings["range"]
+        )
+        self._mappable_preds = frozenset(self.reverse_metamodel_mappings)
 
     def convert(
         self,
@@ -96,12 +201,15 @@ class RdfsImportEngine(ImportEngine):
 
         :param file:
         :param name:
+        :param format: any RDF format supported by rdflib's Graph.parse
+        :param default_prefix:
         :param model_uri:
         :param identifier:
         :param kwargs:
         :return:
         """
         self.mappings = {}
+        self._name_cache = {}
         g = Graph()
         g.parse(file, format=format)
         if name is not None and default_prefix is None:
@@ -122,49 +230,82 @@ class RdfsImportEngine(ImportEngine):
             if default_prefix not in schema.prefixes:
                 sb.add_prefix(default_prefix, model_uri, replace_if_present=True)
             schema.id = schema.prefixes[default_prefix].prefix_reference
-        cls_slots = defaultdict(list)
-        props = []
-        for rdfs_property_metaclass in self._rdfs_metamodel_iri(
-            SlotDefinition.__name__
-        ):
-            for p in g.subjects(RDF.type, rdfs_property_metaclass):
-                props.append(p)
-        # implicit properties
-        for metap in (
-            self.reverse_metamodel_mappings["domain_of"]
-            + self.reverse_metamodel_mappings["rangeIncludes"]
-        ):
-            for p, _, _o in g.triples((None, metap, None)):
-                props.append(p)
-        for p in set(props):
+        ns_prefixes = self._namespace_prefixes(g)
+        cls_slots: Dict[str, List[str]] = {}
+        cls_slot_set: Dict[str, Set[str]] = {}
+        slot_ranges: Dict[str, List[str]] = {}
+        props: Set[URIRef] = set()
+        implicit_props: Set[URIRef] = set()
+        rdfs_classes: Set[URIRef] = set()
+        implicit_classes: Set[URIRef] = set()
+        # index all triples by subject in a single pass over the graph; this also
+        # discovers properties and classes, which is much faster than running
+        # equivalent SPARQL queries through rdflib's pure-Python query engine
+        subj_pos: Dict[URIRef, List[Tuple[URIRef, Any]]] = {}
+        type_of: Dict[URIRef, Set[URIRef]] = {}
+        # namespace attribute access is slow in rdflib, so resolve these once
+        domain_range_preds = self._domain_range_preds
+        rdf_type = RDF.type
+        rdfs_subclass_of = RDFS.subClassOf
+        for s, p, o in _graph_triples(g):
+            subj_pos.setdefault(s, []).append((p, o))
+            if p == rdf_type:
+                type_of.setdefault(s, set()).add(o)
+            elif p in domain_range_preds:
+                # implicit properties
+                implicit_props.add(s)
+            if p == rdfs_subclass_of:
+                # implicit classes
+                implicit_classes.add(s)
+                implicit_classes.add(o)
+        for s, types in type_of.items():
+            if not types.isdisjoint(self._slot_metaclass_iris):
+                props.add(s)
+            if not types.isdisjoint(self._class_metaclass_iris):
+                rdfs_classes.add(s)
+        # explicitly typed properties take precedence on name clashes;
+        # sorted so that slot order within classes is deterministic
+        for p in chain(sorted(props), sorted(implicit_props - props)):
             sn = self.iri_to_name(p)
-            init_dict = self._dict_for_subject(g, p)
+            if sn in schema.slots:
+                logging.warning(f"Skipping {p}: slot {sn} already exists")
+                continue
+            init_dict = self._dict_for_subject(subj_pos.get(p, []), "slot")
             if "domain_of" in init_dict:
                 for x in init_dict["domain_of"]:
-                    cls_slots[x].append(sn)
+                    if sn not in cls_slot_set.setdefault(x, set()):
+                        cls_slot_set[x].add(sn)
+                        cls_slots.setdefault(x, []).append(sn)
                 del init_dict["domain_of"]
-            if "rangeIncludes" in init_dict:
-                init_dict["any_of"] = [{"range": x} for x in init_dict["rangeIncludes"]]
-                del init_dict["rangeIncludes"]
+            # ranges are resolved once all classes are known
+            ranges = init_dict.pop("range", None)
+            if ranges:
+                slot_ranges[sn] = list(dict.fromkeys(ranges))
             slot = SlotDefinition(sn, **init_dict)
-            slot.slot_uri = str(p.n3(g.namespace_manager))
+            slot.slot_uri = self._compact_uri(g, p, ns_prefixes)
             sb.add_slot(slot)
-        rdfs_classes = []
-        for rdfs_class_metaclass in self._rdfs_metamodel_iri(ClassDefinition.__name__):
-            for s in g.subjects(RDF.type, rdfs_class_metaclass):
-                rdfs_classes.append(s)
-        # implicit classes
-        for metap in [RDFS.subClassOf]:
-            for s, _, o in g.triples((None, metap, None)):
-                rdfs_classes.append(s)
-                rdfs_classes.append(o)
-        for s in set(rdfs_classes):
+        # most superclasses are also declared as classes, so each is processed once
+        for s in chain(sorted(rdfs_classes), sorted(implicit_classes - rdfs_classes)):
             cn = self.iri_to_name(s)
-            init_dict = self._dict_for_subject(g, s)
+            init_dict = self._dict_for_subject(subj_pos.get(s, []), "class")
             c = ClassDefinition(cn, **init_dict)
             c.slots = cls_slots.get(cn, [])
-            c.class_uri = str(s.n3(g.namespace_manager))
+            c.class_uri = self._compact_uri(g, s, ns_prefixes)
             sb.add_class(c)
+        # ranges that are neither classes in this schema nor linkml types (e.g.
+        # schema:Text or schema:Thing) fall back to the default range
+        known_ranges = set(schema.classes) | set(_metamodel_type_names())
+        for sn, ranges in slot_ranges.items():
+            slot = schema.slots[sn]
+            for x in ranges:
+                if x not in known_ranges:
+                    logging.warning(f"Dropping unknown range {x} of slot {sn}")
+            ranges = [x for x in ranges if x in known_ranges]
+            # Handle a range of multiple types
+            if len(ranges) == 1:
+                slot.range = ranges[0]
+            elif ranges:
+                slot.any_of = [AnonymousSlotExpression(range=x) for x in ranges]
         if identifier is not None:
             id_slot = SlotDefinition(identifier, identifier=True, range="uriorcurie")
             schema.slots[identifier] = id_slot
@@ -174,38 +315,115 @@ class RdfsImportEngine(ImportEngine):
                         c.slots.append(identifier)
         return schema
 
-    def _dict_for_subject(self, g: Graph, s: URIRef) -> Dict[str, Any]:
+    def _dict_for_subject(
+        self, po_list: List[Tuple[URIRef, Any]], subject_type: str
+    ) -> Dict[str, Any]:
         """
-        Looks up triples for a subject and converts to dict using linkml keys.
+        Converts the predicate-object pairs of a subject to a dict using linkml keys.
 
-        :param g:
-        :param p:
+        :param po_list: predicate-object pairs collected for the subject
+        :param subject_type: "class" or "slot"; only metaslots that belong in that
+            kind of definition are kept
         :return:
         """
         init_dict = {}
-        for pp, obj in g.predicate_objects(s):
-            if pp == RDF.type:
+        # many subjects only carry rdf:type and unmapped annotations
+        if self._mappable_preds.isdisjoint(pp for pp, _ in po_list):
+            return init_dict
+        # bound once, as this loop runs for every triple of every subject
+        metaslot_for_predicate = self._metaslot_for_predicate
+        object_to_value = self._object_to_value
+        rdf_type = RDF.type
+        for pp, obj in po_list:
+            if pp == rdf_type:
                 continue
-            metaslot_name = self._element_from_iri(pp)
-            logging.debug(f"Mapping {pp} -> {metaslot_name}")
-            if metaslot_name not in self.defclass_slots:
+            metaslot_name_safe, multivalued, is_uri_range = metaslot_for_predicate(
+                pp, subject_type
+            )
+            if metaslot_name_safe is None:
                 continue
-            if metaslot_name is None:
-                logging.warning(f"Not mapping {pp}")
-                continue
-            if metaslot_name == "name":
-                metaslot_name = "title"
-            metaslot = self.metamodel.get_slot(metaslot_name)
-            v = self._object_to_value(obj, metaslot=metaslot)
-            metaslot_name_safe = underscore(metaslot_name)
-            if not metaslot or metaslot.multivalued:
-                if metaslot_name_safe not in init_dict:
-                    init_dict[metaslot_name_safe] = []
-                init_dict[metaslot_name_safe].append(v)
+            v = object_to_value(obj, is_uri_range)
+            if multivalued:
+                init_dict.setdefault(metaslot_name_safe, []).append(v)
             else:
                 init_dict[metaslot_name_safe] = v
         return init_dict
 
+    def _metaslot_for_predicate(
+        self, pp: URIRef, subject_type: str
+    ) -> Tuple[Optional[str], bool, bool]:
+        """
+        Resolves a predicate to its underscored metaslot name, whether the metaslot
+        is multivalued, and whether its range is a URI type.
+
+        Results are cached per predicate and subject type; predicates that should
+        not be mapped resolve to ``(None, False, False)``.
+
+        :param pp:
+        :param subject_type: "class" or "slot"
+        :return:
+        """
+        cache = self._pred_cache[subject_type]
+        entry = cache.get(pp)
+        if entry is not None:
+            return entry
+        metaslot_name = self._element_from_iri(pp)
+        logging.debug(f"Mapping {pp} -> {metaslot_name}")
+        allowed = self.defclass_slots if subject_type == "class" else self.slotdef_slots
+        if metaslot_name is None or metaslot_name not in allowed:
+            logging.debug(f"Not mapping {pp}")
+            entry = (None, False, False)
+        else:
+            if metaslot_name == "name":
+                metaslot_name = "title"
+            metaslot = self.metamodel.get_slot(metaslot_name)
+            # range is single-valued in the metamodel, but RDFS properties may
+            # declare several (e.g. schema:rangeIncludes), so collect them all
+            multivalued = not metaslot or bool(metaslot.multivalued) or metaslot_name == "range"
+            is_uri_range = metaslot is not None and metaslot.range in ("uriorcurie", "uri")
+            entry = (underscore(metaslot_name), multivalued, is_uri_range)
+        cache[pp] = entry
+        return entry
+
+    def _namespace_prefixes(self, g: Graph) -> Dict[str, str]:
+        """
+        Maps each namespace bound in the graph to its prefix.
+
+        Namespaces that another bound namespace extends are left out, as rdflib
+        resolves URIs in those to the longest matching namespace.
+
+        :param g:
+        :return:
+        """
+        namespaces = [str(ns) for _, ns in g.namespaces()]
+        ns_prefixes = {}
+        for ns in namespaces:
+            if any(other != ns and other.startswith(ns) for other in namespaces):
+                continue
+            ns_prefixes[ns] = g.store.prefix(URIRef(ns))
+        return ns_prefixes
+
+    def _compact_uri(self, g: Graph, uri: URIRef, ns_prefixes: Dict[str, str]) -> str:
+        """
+        Compacts a URI to a CURIE, equivalent to ``uri.n3(g.namespace_manager)``.
+
+        URIs in a namespace from :meth:`_namespace_prefixes` are compacted directly;
+        anything else falls back to the namespace manager.
+
+        :param g:
+        :param uri:
+        :param ns_prefixes:
+        :return:
+        """
+        try:
+            ns, local = split_uri(uri)
+        except ValueError:
+            ns = None
+        prefix = ns_prefixes.get(ns)
+        if prefix is None:
+            return str(uri.n3(g.namespace_manager))
+        return f"{prefix}:{local}"
+
     def _rdfs_metamodel_iri(self, name: str) -> List[URIRef]:
         return self.metamodel_mappings.get(name, [])
 
@@ -216,24 +434,26 @@ class RdfsImportEngine(ImportEngine):
                 logging.debug(f"Multiple mappings for {iri}: {r}")
             return r[0]
 
-    def _object_to_value(self, obj: Any, metaslot: SlotDefinition = None) -> Any:
-        if isinstance(obj, URIRef):
-            if metaslot.range == "uriorcurie" or metaslot.range == "uri":
-                return str(obj)
-            return self.iri_to_name(obj)
-        if isinstance(obj, Literal):
-            return obj.value
-        return obj
+    def _object_to_value(self, obj: Any, is_uri_range: bool = False) -> Any:
+        converter = _OBJECT_CONVERTERS.get(type(obj))
+        if converter is None:
+            return obj
+        return converter(self, obj, is_uri_range)
 
     def iri_to_name(self, v: URIRef) -> str:
+        cached = self._name_cache.get(v)
+        if cached is not None:
+            return cached
         n = self._as_name(v)
         if n != v:
             self.mappings[n] = v
+        self._name_cache[v] = n
         return n
 
     def _as_name(self, v: URIRef):
         v = str(v)
-        for sep in ["#", "/", ":"]:
-            if sep in v:
-                return v.split(sep)[-1]
+        for sep in ("#", "/", ":"):
+            i = v.rfind(sep)
+            if i >= 0:
+                return v[i + 1:]
         return v
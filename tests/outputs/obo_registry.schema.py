@@ -0,0 +1,960 @@
+# Auto generated from obo_registry.schema.yaml by pythongen.py version: 0.0.1
+# Generation date: 2026-10-15T22:39:14
+# Schema: registry_schema
+#
+# id: https://example.org/registry_schema
+# description:
+# license: https://creativecommons.org/publicdomain/zero/1.0/
+
+import dataclasses
+import re
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time
+)
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+
+from jsonasobj2 import (
+    JsonObj,
+    as_dict
+)
+from linkml_runtime.linkml_model.meta import (
+    EnumDefinition,
+    PermissibleValue,
+    PvFormulaOptions
+)
+from linkml_runtime.utils.curienamespace import CurieNamespace
+from linkml_runtime.utils.dataclass_extensions_376 import dataclasses_init_fn_with_kwargs
+from linkml_runtime.utils.enumerations import EnumDefinitionImpl
+from linkml_runtime.utils.formatutils import (
+    camelcase,
+    sfx,
+    underscore
+)
+from linkml_runtime.utils.metamodelcore import (
+    bnode,
+    empty_dict,
+    empty_list
+)
+from linkml_runtime.utils.slot import Slot
+from linkml_runtime.utils.yamlutils import (
+    YAMLRoot,
+    extended_float,
+    extended_int,
+    extended_str
+)
+from rdflib import (
+    Namespace,
+    URIRef
+)
+
+from linkml_runtime.linkml_model.types import Boolean, String
+from linkml_runtime.utils.metamodelcore import Bool
+
+metamodel_version = "1.7.0"
+version = None
+
+# Overwrite dataclasses _init_fn to add **kwargs in __init__
+dataclasses._init_fn = dataclasses_init_fn_with_kwargs
+
+# Namespaces
+LINKML = CurieNamespace('linkml', 'https://w3id.org/linkml/')
+REGISTRY_SCHEMA = CurieNamespace('registry_schema', 'https://example.org/registry_schema')
+DEFAULT_ = REGISTRY_SCHEMA
+
+
+# Types
+
+# Class references
+
+
+
+@dataclass(repr=False)
+class Browser(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["Browser"]
+    class_class_curie: ClassVar[str] = "registry_schema:Browser"
+    class_name: ClassVar[str] = "Browser"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.Browser
+
+    label: str = None
+    title: str = None
+    url: str = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.label):
+            self.MissingRequiredField("label")
+        if not isinstance(self.label, str):
+            self.label = str(self.label)
+
+        if self._is_empty(self.title):
+            self.MissingRequiredField("title")
+        if not isinstance(self.title, str):
+            self.title = str(self.title)
+
+        if self._is_empty(self.url):
+            self.MissingRequiredField("url")
+        if not isinstance(self.url, str):
+            self.url = str(self.url)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Product(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["Product"]
+    class_class_curie: ClassVar[str] = "registry_schema:Product"
+    class_name: ClassVar[str] = "Product"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.Product
+
+    id: str = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.id):
+            self.MissingRequiredField("id")
+        if not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Publication(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["Publication"]
+    class_class_curie: ClassVar[str] = "registry_schema:Publication"
+    class_name: ClassVar[str] = "Publication"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.Publication
+
+    id: str = None
+    title: str = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.id):
+            self.MissingRequiredField("id")
+        if not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self._is_empty(self.title):
+            self.MissingRequiredField("title")
+        if not isinstance(self.title, str):
+            self.title = str(self.title)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Example(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["Example"]
+    class_class_curie: ClassVar[str] = "registry_schema:Example"
+    class_name: ClassVar[str] = "Example"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.Example
+
+    url: str = None
+    description: str = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.url):
+            self.MissingRequiredField("url")
+        if not isinstance(self.url, str):
+            self.url = str(self.url)
+
+        if self._is_empty(self.description):
+            self.MissingRequiredField("description")
+        if not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Usage(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["Usage"]
+    class_class_curie: ClassVar[str] = "registry_schema:Usage"
+    class_name: ClassVar[str] = "Usage"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.Usage
+
+    user: str = None
+    description: str = None
+    type: Optional[str] = None
+    seeAlso: Optional[str] = None
+    examples: Optional[Union[Union[dict, Example], List[Union[dict, Example]]]] = empty_list()
+    publications: Optional[Union[Union[dict, Publication], List[Union[dict, Publication]]]] = empty_list()
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.user):
+            self.MissingRequiredField("user")
+        if not isinstance(self.user, str):
+            self.user = str(self.user)
+
+        if self._is_empty(self.description):
+            self.MissingRequiredField("description")
+        if not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if self.type is not None and not isinstance(self.type, str):
+            self.type = str(self.type)
+
+        if self.seeAlso is not None and not isinstance(self.seeAlso, str):
+            self.seeAlso = str(self.seeAlso)
+
+        self._normalize_inlined_as_dict(slot_name="examples", slot_type=Example, key_name="url", keyed=False)
+
+        self._normalize_inlined_as_dict(slot_name="publications", slot_type=Publication, key_name="id", keyed=False)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class RegistrySchema(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = REGISTRY_SCHEMA["RegistrySchema"]
+    class_class_curie: ClassVar[str] = "registry_schema:RegistrySchema"
+    class_name: ClassVar[str] = "RegistrySchema"
+    class_model_uri: ClassVar[URIRef] = REGISTRY_SCHEMA.RegistrySchema
+
+    activity_status: Union[str, "ActivityStatusOptions"] = None
+    contact: str = None
+    description: str = None
+    homepage: str = None
+    id: str = None
+    layout: Union[str, "LayoutOptions"] = None
+    license: str = None
+    products: Union[Union[dict, Product], List[Union[dict, Product]]] = None
+    title: str = None
+    tracker: str = None
+    aberowl_id: Optional[str] = None
+    alternative_prefix: Optional[str] = None
+    alternatePrefix: Optional[str] = None
+    alternativePrefix: Optional[str] = None
+    biosharing: Optional[str] = None
+    browsers: Optional[Union[Union[dict, Browser], List[Union[dict, Browser]]]] = empty_list()
+    build: Optional[str] = None
+    canonical: Optional[str] = None
+    created_with: Optional[str] = None
+    createdWith: Optional[str] = None
+    dependencies: Optional[str] = None
+    development: Optional[str] = None
+    depicted_by: Optional[str] = None
+    documentation: Optional[str] = None
+    domain: Optional[str] = None
+    do_wiki: Optional[str] = None
+    DO_wiki: Optional[str] = None
+    example_class: Optional[str] = None
+    exampleClass: Optional[str] = None
+    facebook: Optional[str] = None
+    funded_by: Optional[str] = None
+    google_plus: Optional[str] = None
+    in_foundry: Optional[Union[bool, Bool]] = None
+    in_foundry_order: Optional[str] = None
+    integration_server: Optional[str] = None
+    is_obsolete: Optional[Union[bool, Bool]] = None
+    jobs: Optional[str] = None
+    label: Optional[str] = None
+    mailing_list: Optional[str] = None
+    ontology_purl: Optional[str] = None
+    page: Optional[str] = None
+    preferred_prefix: Optional[str] = None
+    preferredPrefix: Optional[str] = None
+    publications: Optional[Union[Union[dict, Publication], List[Union[dict, Publication]]]] = empty_list()
+    redirects: Optional[str] = None
+    releases: Optional[str] = None
+    replaced_by: Optional[str] = None
+    repository: Optional[str] = None
+    review: Optional[str] = None
+    slack: Optional[str] = None
+    source: Optional[str] = None
+    source_url: Optional[str] = None
+    taxon: Optional[str] = None
+    termgenie: Optional[str] = None
+    ty: Optional[str] = None
+    type: Optional[str] = None
+    twitter: Optional[str] = None
+    usages: Optional[Union[Union[dict, Usage], List[Union[dict, Usage]]]] = empty_list()
+    used_by: Optional[str] = None
+    validate: Optional[str] = None
+    was_derived_from: Optional[str] = None
+    wasDerivedFrom: Optional[str] = None
+    wikidata_template: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.activity_status):
+            self.MissingRequiredField("activity_status")
+        if not isinstance(self.activity_status, ActivityStatusOptions):
+            self.activity_status = ActivityStatusOptions(self.activity_status)
+
+        if self._is_empty(self.contact):
+            self.MissingRequiredField("contact")
+        if not isinstance(self.contact, str):
+            self.contact = str(self.contact)
+
+        if self._is_empty(self.description):
+            self.MissingRequiredField("description")
+        if not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if self._is_empty(self.homepage):
+            self.MissingRequiredField("homepage")
+        if not isinstance(self.homepage, str):
+            self.homepage = str(self.homepage)
+
+        if self._is_empty(self.id):
+            self.MissingRequiredField("id")
+        if not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self._is_empty(self.layout):
+            self.MissingRequiredField("layout")
+        if not isinstance(self.layout, LayoutOptions):
+            self.layout = LayoutOptions(self.layout)
+
+        if self._is_empty(self.license):
+            self.MissingRequiredField("license")
+        if not isinstance(self.license, str):
+            self.license = str(self.license)
+
+        if self._is_empty(self.products):
+            self.MissingRequiredField("products")
+        self._normalize_inlined_as_dict(slot_name="products", slot_type=Product, key_name="id", keyed=False)
+
+        if self._is_empty(self.title):
+            self.MissingRequiredField("title")
+        if not isinstance(self.title, str):
+            self.title = str(self.title)
+
+        if self._is_empty(self.tracker):
+            self.MissingRequiredField("tracker")
+        if not isinstance(self.tracker, str):
+            self.tracker = str(self.tracker)
+
+        if self.aberowl_id is not None and not isinstance(self.aberowl_id, str):
+            self.aberowl_id = str(self.aberowl_id)
+
+        if self.alternative_prefix is not None and not isinstance(self.alternative_prefix, str):
+            self.alternative_prefix = str(self.alternative_prefix)
+
+        if self.alternatePrefix is not None and not isinstance(self.alternatePrefix, str):
+            self.alternatePrefix = str(self.alternatePrefix)
+
+        if self.alternativePrefix is not None and not isinstance(self.alternativePrefix, str):
+            self.alternativePrefix = str(self.alternativePrefix)
+
+        if self.biosharing is not None and not isinstance(self.biosharing, str):
+            self.biosharing = str(self.biosharing)
+
+        self._normalize_inlined_as_dict(slot_name="browsers", slot_type=Browser, key_name="label", keyed=False)
+
+        if self.build is not None and not isinstance(self.build, str):
+            self.build = str(self.build)
+
+        if self.canonical is not None and not isinstance(self.canonical, str):
+            self.canonical = str(self.canonical)
+
+        if self.created_with is not None and not isinstance(self.created_with, str):
+            self.created_with = str(self.created_with)
+
+        if self.createdWith is not None and not isinstance(self.createdWith, str):
+            self.createdWith = str(self.createdWith)
+
+        if self.dependencies is not None and not isinstance(self.dependencies, str):
+            self.dependencies = str(self.dependencies)
+
+        if self.development is not None and not isinstance(self.development, str):
+            self.development = str(self.development)
+
+        if self.depicted_by is not None and not isinstance(self.depicted_by, str):
+            self.depicted_by = str(self.depicted_by)
+
+        if self.documentation is not None and not isinstance(self.documentation, str):
+            self.documentation = str(self.documentation)
+
+        if self.domain is not None and not isinstance(self.domain, str):
+            self.domain = str(self.domain)
+
+        if self.do_wiki is not None and not isinstance(self.do_wiki, str):
+            self.do_wiki = str(self.do_wiki)
+
+        if self.DO_wiki is not None and not isinstance(self.DO_wiki, str):
+            self.DO_wiki = str(self.DO_wiki)
+
+        if self.example_class is not None and not isinstance(self.example_class, str):
+            self.example_class = str(self.example_class)
+
+        if self.exampleClass is not None and not isinstance(self.exampleClass, str):
+            self.exampleClass = str(self.exampleClass)
+
+        if self.facebook is not None and not isinstance(self.facebook, str):
+            self.facebook = str(self.facebook)
+
+        if self.funded_by is not None and not isinstance(self.funded_by, str):
+            self.funded_by = str(self.funded_by)
+
+        if self.google_plus is not None and not isinstance(self.google_plus, str):
+            self.google_plus = str(self.google_plus)
+
+        if self.in_foundry is not None and not isinstance(self.in_foundry, Bool):
+            self.in_foundry = Bool(self.in_foundry)
+
+        if self.in_foundry_order is not None and not isinstance(self.in_foundry_order, str):
+            self.in_foundry_order = str(self.in_foundry_order)
+
+        if self.integration_server is not None and not isinstance(self.integration_server, str):
+            self.integration_server = str(self.integration_server)
+
+        if self.is_obsolete is not None and not isinstance(self.is_obsolete, Bool):
+            self.is_obsolete = Bool(self.is_obsolete)
+
+        if self.jobs is not None and not isinstance(self.jobs, str):
+            self.jobs = str(self.jobs)
+
+        if self.label is not None and not isinstance(self.label, str):
+            self.label = str(self.label)
+
+        if self.mailing_list is not None and not isinstance(self.mailing_list, str):
+            self.mailing_list = str(self.mailing_list)
+
+        if self.ontology_purl is not None and not isinstance(self.ontology_purl, str):
+            self.ontology_purl = str(self.ontology_purl)
+
+        if self.page is not None and not isinstance(self.page, str):
+            self.page = str(self.page)
+
+        if self.preferred_prefix is not None and not isinstance(self.preferred_prefix, str):
+            self.preferred_prefix = str(self.preferred_prefix)
+
+        if self.preferredPrefix is not None and not isinstance(self.preferredPrefix, str):
+            self.preferredPrefix = str(self.preferredPrefix)
+
+        self._normalize_inlined_as_dict(slot_name="publications", slot_type=Publication, key_name="id", keyed=False)
+
+        if self.redirects is not None and not isinstance(self.redirects, str):
+            self.redirects = str(self.redirects)
+
+        if self.releases is not None and not isinstance(self.releases, str):
+            self.releases = str(self.releases)
+
+        if self.replaced_by is not None and not isinstance(self.replaced_by, str):
+            self.replaced_by = str(self.replaced_by)
+
+        if self.repository is not None and not isinstance(self.repository, str):
+            self.repository = str(self.repository)
+
+        if self.review is not None and not isinstance(self.review, str):
+            self.review = str(self.review)
+
+        if self.slack is not None and not isinstance(self.slack, str):
+            self.slack = str(self.slack)
+
+        if self.source is not None and not isinstance(self.source, str):
+            self.source = str(self.source)
+
+        if self.source_url is not None and not isinstance(self.source_url, str):
+            self.source_url = str(self.source_url)
+
+        if self.taxon is not None and not isinstance(self.taxon, str):
+            self.taxon = str(self.taxon)
+
+        if self.termgenie is not None and not isinstance(self.termgenie, str):
+            self.termgenie = str(self.termgenie)
+
+        if self.ty is not None and not isinstance(self.ty, str):
+            self.ty = str(self.ty)
+
+        if self.type is not None and not isinstance(self.type, str):
+            self.type = str(self.type)
+
+        if self.twitter is not None and not isinstance(self.twitter, str):
+            self.twitter = str(self.twitter)
+
+        self._normalize_inlined_as_dict(slot_name="usages", slot_type=Usage, key_name="user", keyed=False)
+
+        if self.used_by is not None and not isinstance(self.used_by, str):
+            self.used_by = str(self.used_by)
+
+        if self.validate is not None and not isinstance(self.validate, str):
+            self.validate = str(self.validate)
+
+        if self.was_derived_from is not None and not isinstance(self.was_derived_from, str):
+            self.was_derived_from = str(self.was_derived_from)
+
+        if self.wasDerivedFrom is not None and not isinstance(self.wasDerivedFrom, str):
+            self.wasDerivedFrom = str(self.wasDerivedFrom)
+
+        if self.wikidata_template is not None and not isinstance(self.wikidata_template, str):
+            self.wikidata_template = str(self.wikidata_template)
+
+        super().__post_init__(**kwargs)
+
+
+# Enumerations
+class ActivityStatusOptions(EnumDefinitionImpl):
+
+    active = PermissibleValue(text="active")
+    inactive = PermissibleValue(text="inactive")
+    orphaned = PermissibleValue(text="orphaned")
+
+    _defn = EnumDefinition(
+        name="ActivityStatusOptions",
+    )
+
+class LayoutOptions(EnumDefinitionImpl):
+
+    ontology_detail = PermissibleValue(text="ontology_detail")
+
+    _defn = EnumDefinition(
+        name="LayoutOptions",
+    )
+
+# Slots
+class slots:
+    pass
+
+slots.aberowl_id = Slot(uri=REGISTRY_SCHEMA.aberowl_id, name="aberowl_id", curie=REGISTRY_SCHEMA.curie('aberowl_id'),
+                   model_uri=REGISTRY_SCHEMA.aberowl_id, domain=None, range=Optional[str])
+
+slots.activity_status = Slot(uri=REGISTRY_SCHEMA.activity_status, name="activity_status", curie=REGISTRY_SCHEMA.curie('activity_status'),
+                   model_uri=REGISTRY_SCHEMA.activity_status, domain=None, range=Union[str, "ActivityStatusOptions"])
+
+slots.alternative_prefix = Slot(uri=REGISTRY_SCHEMA.alternative_prefix, name="alternative_prefix", curie=REGISTRY_SCHEMA.curie('alternative_prefix'),
+                   model_uri=REGISTRY_SCHEMA.alternative_prefix, domain=None, range=Optional[str])
+
+slots.alternatePrefix = Slot(uri=REGISTRY_SCHEMA.alternatePrefix, name="alternatePrefix", curie=REGISTRY_SCHEMA.curie('alternatePrefix'),
+                   model_uri=REGISTRY_SCHEMA.alternatePrefix, domain=None, range=Optional[str])
+
+slots.alternativePrefix = Slot(uri=REGISTRY_SCHEMA.alternativePrefix, name="alternativePrefix", curie=REGISTRY_SCHEMA.curie('alternativePrefix'),
+                   model_uri=REGISTRY_SCHEMA.alternativePrefix, domain=None, range=Optional[str])
+
+slots.biosharing = Slot(uri=REGISTRY_SCHEMA.biosharing, name="biosharing", curie=REGISTRY_SCHEMA.curie('biosharing'),
+                   model_uri=REGISTRY_SCHEMA.biosharing, domain=None, range=Optional[str])
+
+slots.label = Slot(uri=REGISTRY_SCHEMA.label, name="label", curie=REGISTRY_SCHEMA.curie('label'),
+                   model_uri=REGISTRY_SCHEMA.label, domain=None, range=Optional[str])
+
+slots.title = Slot(uri=REGISTRY_SCHEMA.title, name="title", curie=REGISTRY_SCHEMA.curie('title'),
+                   model_uri=REGISTRY_SCHEMA.title, domain=None, range=str)
+
+slots.url = Slot(uri=REGISTRY_SCHEMA.url, name="url", curie=REGISTRY_SCHEMA.curie('url'),
+                   model_uri=REGISTRY_SCHEMA.url, domain=None, range=str)
+
+slots.browsers = Slot(uri=REGISTRY_SCHEMA.browsers, name="browsers", curie=REGISTRY_SCHEMA.curie('browsers'),
+                   model_uri=REGISTRY_SCHEMA.browsers, domain=None, range=Optional[Union[Union[dict, Browser], List[Union[dict, Browser]]]])
+
+slots.build = Slot(uri=REGISTRY_SCHEMA.build, name="build", curie=REGISTRY_SCHEMA.curie('build'),
+                   model_uri=REGISTRY_SCHEMA.build, domain=None, range=Optional[str])
+
+slots.canonical = Slot(uri=REGISTRY_SCHEMA.canonical, name="canonical", curie=REGISTRY_SCHEMA.curie('canonical'),
+                   model_uri=REGISTRY_SCHEMA.canonical, domain=None, range=Optional[str])
+
+slots.contact = Slot(uri=REGISTRY_SCHEMA.contact, name="contact", curie=REGISTRY_SCHEMA.curie('contact'),
+                   model_uri=REGISTRY_SCHEMA.contact, domain=None, range=str)
+
+slots.created_with = Slot(uri=REGISTRY_SCHEMA.created_with, name="created_with", curie=REGISTRY_SCHEMA.curie('created_with'),
+                   model_uri=REGISTRY_SCHEMA.created_with, domain=None, range=Optional[str])
+
+slots.createdWith = Slot(uri=REGISTRY_SCHEMA.createdWith, name="createdWith", curie=REGISTRY_SCHEMA.curie('createdWith'),
+                   model_uri=REGISTRY_SCHEMA.createdWith, domain=None, range=Optional[str])
+
+slots.description = Slot(uri=REGISTRY_SCHEMA.description, name="description", curie=REGISTRY_SCHEMA.curie('description'),
+                   model_uri=REGISTRY_SCHEMA.description, domain=None, range=str)
+
+slots.dependencies = Slot(uri=REGISTRY_SCHEMA.dependencies, name="dependencies", curie=REGISTRY_SCHEMA.curie('dependencies'),
+                   model_uri=REGISTRY_SCHEMA.dependencies, domain=None, range=Optional[str])
+
+slots.development = Slot(uri=REGISTRY_SCHEMA.development, name="development", curie=REGISTRY_SCHEMA.curie('development'),
+                   model_uri=REGISTRY_SCHEMA.development, domain=None, range=Optional[str])
+
+slots.depicted_by = Slot(uri=REGISTRY_SCHEMA.depicted_by, name="depicted_by", curie=REGISTRY_SCHEMA.curie('depicted_by'),
+                   model_uri=REGISTRY_SCHEMA.depicted_by, domain=None, range=Optional[str])
+
+slots.documentation = Slot(uri=REGISTRY_SCHEMA.documentation, name="documentation", curie=REGISTRY_SCHEMA.curie('documentation'),
+                   model_uri=REGISTRY_SCHEMA.documentation, domain=None, range=Optional[str])
+
+slots.domain = Slot(uri=REGISTRY_SCHEMA.domain, name="domain", curie=REGISTRY_SCHEMA.curie('domain'),
+                   model_uri=REGISTRY_SCHEMA.domain, domain=None, range=Optional[str])
+
+slots.do_wiki = Slot(uri=REGISTRY_SCHEMA.do_wiki, name="do_wiki", curie=REGISTRY_SCHEMA.curie('do_wiki'),
+                   model_uri=REGISTRY_SCHEMA.do_wiki, domain=None, range=Optional[str])
+
+slots.DO_wiki = Slot(uri=REGISTRY_SCHEMA.DO_wiki, name="DO wiki", curie=REGISTRY_SCHEMA.curie('DO_wiki'),
+                   model_uri=REGISTRY_SCHEMA.DO_wiki, domain=None, range=Optional[str])
+
+slots.example_class = Slot(uri=REGISTRY_SCHEMA.example_class, name="example_class", curie=REGISTRY_SCHEMA.curie('example_class'),
+                   model_uri=REGISTRY_SCHEMA.example_class, domain=None, range=Optional[str])
+
+slots.exampleClass = Slot(uri=REGISTRY_SCHEMA.exampleClass, name="exampleClass", curie=REGISTRY_SCHEMA.curie('exampleClass'),
+                   model_uri=REGISTRY_SCHEMA.exampleClass, domain=None, range=Optional[str])
+
+slots.facebook = Slot(uri=REGISTRY_SCHEMA.facebook, name="facebook", curie=REGISTRY_SCHEMA.curie('facebook'),
+                   model_uri=REGISTRY_SCHEMA.facebook, domain=None, range=Optional[str])
+
+slots.funded_by = Slot(uri=REGISTRY_SCHEMA.funded_by, name="funded_by", curie=REGISTRY_SCHEMA.curie('funded_by'),
+                   model_uri=REGISTRY_SCHEMA.funded_by, domain=None, range=Optional[str])
+
+slots.google_plus = Slot(uri=REGISTRY_SCHEMA.google_plus, name="google_plus", curie=REGISTRY_SCHEMA.curie('google_plus'),
+                   model_uri=REGISTRY_SCHEMA.google_plus, domain=None, range=Optional[str])
+
+slots.homepage = Slot(uri=REGISTRY_SCHEMA.homepage, name="homepage", curie=REGISTRY_SCHEMA.curie('homepage'),
+                   model_uri=REGISTRY_SCHEMA.homepage, domain=None, range=str)
+
+slots.id = Slot(uri=REGISTRY_SCHEMA.id, name="id", curie=REGISTRY_SCHEMA.curie('id'),
+                   model_uri=REGISTRY_SCHEMA.id, domain=None, range=str)
+
+slots.in_foundry = Slot(uri=REGISTRY_SCHEMA.in_foundry, name="in_foundry", curie=REGISTRY_SCHEMA.curie('in_foundry'),
+                   model_uri=REGISTRY_SCHEMA.in_foundry, domain=None, range=Optional[Union[bool, Bool]])
+
+slots.in_foundry_order = Slot(uri=REGISTRY_SCHEMA.in_foundry_order, name="in_foundry_order", curie=REGISTRY_SCHEMA.curie('in_foundry_order'),
+                   model_uri=REGISTRY_SCHEMA.in_foundry_order, domain=None, range=Optional[str])
+
+slots.integration_server = Slot(uri=REGISTRY_SCHEMA.integration_server, name="integration_server", curie=REGISTRY_SCHEMA.curie('integration_server'),
+                   model_uri=REGISTRY_SCHEMA.integration_server, domain=None, range=Optional[str])
+
+slots.is_obsolete = Slot(uri=REGISTRY_SCHEMA.is_obsolete, name="is_obsolete", curie=REGISTRY_SCHEMA.curie('is_obsolete'),
+                   model_uri=REGISTRY_SCHEMA.is_obsolete, domain=None, range=Optional[Union[bool, Bool]])
+
+slots.jobs = Slot(uri=REGISTRY_SCHEMA.jobs, name="jobs", curie=REGISTRY_SCHEMA.curie('jobs'),
+                   model_uri=REGISTRY_SCHEMA.jobs, domain=None, range=Optional[str])
+
+slots.layout = Slot(uri=REGISTRY_SCHEMA.layout, name="layout", curie=REGISTRY_SCHEMA.curie('layout'),
+                   model_uri=REGISTRY_SCHEMA.layout, domain=None, range=Union[str, "LayoutOptions"])
+
+slots.license = Slot(uri=REGISTRY_SCHEMA.license, name="license", curie=REGISTRY_SCHEMA.curie('license'),
+                   model_uri=REGISTRY_SCHEMA.license, domain=None, range=str)
+
+slots.mailing_list = Slot(uri=REGISTRY_SCHEMA.mailing_list, name="mailing_list", curie=REGISTRY_SCHEMA.curie('mailing_list'),
+                   model_uri=REGISTRY_SCHEMA.mailing_list, domain=None, range=Optional[str])
+
+slots.ontology_purl = Slot(uri=REGISTRY_SCHEMA.ontology_purl, name="ontology_purl", curie=REGISTRY_SCHEMA.curie('ontology_purl'),
+                   model_uri=REGISTRY_SCHEMA.ontology_purl, domain=None, range=Optional[str])
+
+slots.page = Slot(uri=REGISTRY_SCHEMA.page, name="page", curie=REGISTRY_SCHEMA.curie('page'),
+                   model_uri=REGISTRY_SCHEMA.page, domain=None, range=Optional[str])
+
+slots.preferred_prefix = Slot(uri=REGISTRY_SCHEMA.preferred_prefix, name="preferred_prefix", curie=REGISTRY_SCHEMA.curie('preferred_prefix'),
+                   model_uri=REGISTRY_SCHEMA.preferred_prefix, domain=None, range=Optional[str])
+
+slots.preferredPrefix = Slot(uri=REGISTRY_SCHEMA.preferredPrefix, name="preferredPrefix", curie=REGISTRY_SCHEMA.curie('preferredPrefix'),
+                   model_uri=REGISTRY_SCHEMA.preferredPrefix, domain=None, range=Optional[str])
+
+slots.products = Slot(uri=REGISTRY_SCHEMA.products, name="products", curie=REGISTRY_SCHEMA.curie('products'),
+                   model_uri=REGISTRY_SCHEMA.products, domain=None, range=Union[Union[dict, Product], List[Union[dict, Product]]])
+
+slots.publications = Slot(uri=REGISTRY_SCHEMA.publications, name="publications", curie=REGISTRY_SCHEMA.curie('publications'),
+                   model_uri=REGISTRY_SCHEMA.publications, domain=None, range=Optional[Union[Union[dict, Publication], List[Union[dict, Publication]]]])
+
+slots.redirects = Slot(uri=REGISTRY_SCHEMA.redirects, name="redirects", curie=REGISTRY_SCHEMA.curie('redirects'),
+                   model_uri=REGISTRY_SCHEMA.redirects, domain=None, range=Optional[str])
+
+slots.releases = Slot(uri=REGISTRY_SCHEMA.releases, name="releases", curie=REGISTRY_SCHEMA.curie('releases'),
+                   model_uri=REGISTRY_SCHEMA.releases, domain=None, range=Optional[str])
+
+slots.replaced_by = Slot(uri=REGISTRY_SCHEMA.replaced_by, name="replaced_by", curie=REGISTRY_SCHEMA.curie('replaced_by'),
+                   model_uri=REGISTRY_SCHEMA.replaced_by, domain=None, range=Optional[str])
+
+slots.repository = Slot(uri=REGISTRY_SCHEMA.repository, name="repository", curie=REGISTRY_SCHEMA.curie('repository'),
+                   model_uri=REGISTRY_SCHEMA.repository, domain=None, range=Optional[str])
+
+slots.review = Slot(uri=REGISTRY_SCHEMA.review, name="review", curie=REGISTRY_SCHEMA.curie('review'),
+                   model_uri=REGISTRY_SCHEMA.review, domain=None, range=Optional[str])
+
+slots.slack = Slot(uri=REGISTRY_SCHEMA.slack, name="slack", curie=REGISTRY_SCHEMA.curie('slack'),
+                   model_uri=REGISTRY_SCHEMA.slack, domain=None, range=Optional[str])
+
+slots.source = Slot(uri=REGISTRY_SCHEMA.source, name="source", curie=REGISTRY_SCHEMA.curie('source'),
+                   model_uri=REGISTRY_SCHEMA.source, domain=None, range=Optional[str])
+
+slots.source_url = Slot(uri=REGISTRY_SCHEMA.source_url, name="source_url", curie=REGISTRY_SCHEMA.curie('source_url'),
+                   model_uri=REGISTRY_SCHEMA.source_url, domain=None, range=Optional[str])
+
+slots.taxon = Slot(uri=REGISTRY_SCHEMA.taxon, name="taxon", curie=REGISTRY_SCHEMA.curie('taxon'),
+                   model_uri=REGISTRY_SCHEMA.taxon, domain=None, range=Optional[str])
+
+slots.termgenie = Slot(uri=REGISTRY_SCHEMA.termgenie, name="termgenie", curie=REGISTRY_SCHEMA.curie('termgenie'),
+                   model_uri=REGISTRY_SCHEMA.termgenie, domain=None, range=Optional[str])
+
+slots.tracker = Slot(uri=REGISTRY_SCHEMA.tracker, name="tracker", curie=REGISTRY_SCHEMA.curie('tracker'),
+                   model_uri=REGISTRY_SCHEMA.tracker, domain=None, range=str)
+
+slots.ty = Slot(uri=REGISTRY_SCHEMA.ty, name="ty", curie=REGISTRY_SCHEMA.curie('ty'),
+                   model_uri=REGISTRY_SCHEMA.ty, domain=None, range=Optional[str])
+
+slots.type = Slot(uri=REGISTRY_SCHEMA.type, name="type", curie=REGISTRY_SCHEMA.curie('type'),
+                   model_uri=REGISTRY_SCHEMA.type, domain=None, range=Optional[str])
+
+slots.twitter = Slot(uri=REGISTRY_SCHEMA.twitter, name="twitter", curie=REGISTRY_SCHEMA.curie('twitter'),
+                   model_uri=REGISTRY_SCHEMA.twitter, domain=None, range=Optional[str])
+
+slots.user = Slot(uri=REGISTRY_SCHEMA.user, name="user", curie=REGISTRY_SCHEMA.curie('user'),
+                   model_uri=REGISTRY_SCHEMA.user, domain=None, range=str)
+
+slots.seeAlso = Slot(uri=REGISTRY_SCHEMA.seeAlso, name="seeAlso", curie=REGISTRY_SCHEMA.curie('seeAlso'),
+                   model_uri=REGISTRY_SCHEMA.seeAlso, domain=None, range=Optional[str])
+
+slots.examples = Slot(uri=REGISTRY_SCHEMA.examples, name="examples", curie=REGISTRY_SCHEMA.curie('examples'),
+                   model_uri=REGISTRY_SCHEMA.examples, domain=None, range=Optional[Union[Union[dict, Example], List[Union[dict, Example]]]])
+
+slots.usages = Slot(uri=REGISTRY_SCHEMA.usages, name="usages", curie=REGISTRY_SCHEMA.curie('usages'),
+                   model_uri=REGISTRY_SCHEMA.usages, domain=None, range=Optional[Union[Union[dict, Usage], List[Union[dict, Usage]]]])
+
+slots.used_by = Slot(uri=REGISTRY_SCHEMA.used_by, name="used_by", curie=REGISTRY_SCHEMA.curie('used_by'),
+                   model_uri=REGISTRY_SCHEMA.used_by, domain=None, range=Optional[str])
+
+slots.validate = Slot(uri=REGISTRY_SCHEMA.validate, name="validate", curie=REGISTRY_SCHEMA.curie('validate'),
+                   model_uri=REGISTRY_SCHEMA.validate, domain=None, range=Optional[str])
+
+slots.was_derived_from = Slot(uri=REGISTRY_SCHEMA.was_derived_from, name="was_derived_from", curie=REGISTRY_SCHEMA.curie('was_derived_from'),
+                   model_uri=REGISTRY_SCHEMA.was_derived_from, domain=None, range=Optional[str])
+
+slots.wasDerivedFrom = Slot(uri=REGISTRY_SCHEMA.wasDerivedFrom, name="wasDerivedFrom", curie=REGISTRY_SCHEMA.curie('wasDerivedFrom'),
+                   model_uri=REGISTRY_SCHEMA.wasDerivedFrom, domain=None, range=Optional[str])
+
+slots.wikidata_template = Slot(uri=REGISTRY_SCHEMA.wikidata_template, name="wikidata_template", curie=REGISTRY_SCHEMA.curie('wikidata_template'),
+                   model_uri=REGISTRY_SCHEMA.wikidata_template, domain=None, range=Optional[str])
+
+slots.Browser_label = Slot(uri=REGISTRY_SCHEMA.label, name="Browser_label", curie=REGISTRY_SCHEMA.curie('label'),
+                   model_uri=REGISTRY_SCHEMA.Browser_label, domain=Browser, range=str)
+
+slots.Browser_title = Slot(uri=REGISTRY_SCHEMA.title, name="Browser_title", curie=REGISTRY_SCHEMA.curie('title'),
+                   model_uri=REGISTRY_SCHEMA.Browser_title, domain=Browser, range=str)
+
+slots.Browser_url = Slot(uri=REGISTRY_SCHEMA.url, name="Browser_url", curie=REGISTRY_SCHEMA.curie('url'),
+                   model_uri=REGISTRY_SCHEMA.Browser_url, domain=Browser, range=str)
+
+slots.Product_id = Slot(uri=REGISTRY_SCHEMA.id, name="Product_id", curie=REGISTRY_SCHEMA.curie('id'),
+                   model_uri=REGISTRY_SCHEMA.Product_id, domain=Product, range=str)
+
+slots.Publication_id = Slot(uri=REGISTRY_SCHEMA.id, name="Publication_id", curie=REGISTRY_SCHEMA.curie('id'),
+                   model_uri=REGISTRY_SCHEMA.Publication_id, domain=Publication, range=str)
+
+slots.Publication_title = Slot(uri=REGISTRY_SCHEMA.title, name="Publication_title", curie=REGISTRY_SCHEMA.curie('title'),
+                   model_uri=REGISTRY_SCHEMA.Publication_title, domain=Publication, range=str)
+
+slots.Example_url = Slot(uri=REGISTRY_SCHEMA.url, name="Example_url", curie=REGISTRY_SCHEMA.curie('url'),
+                   model_uri=REGISTRY_SCHEMA.Example_url, domain=Example, range=str)
+
+slots.Example_description = Slot(uri=REGISTRY_SCHEMA.description, name="Example_description", curie=REGISTRY_SCHEMA.curie('description'),
+                   model_uri=REGISTRY_SCHEMA.Example_description, domain=Example, range=str)
+
+slots.Usage_user = Slot(uri=REGISTRY_SCHEMA.user, name="Usage_user", curie=REGISTRY_SCHEMA.curie('user'),
+                   model_uri=REGISTRY_SCHEMA.Usage_user, domain=Usage, range=str)
+
+slots.Usage_type = Slot(uri=REGISTRY_SCHEMA.type, name="Usage_type", curie=REGISTRY_SCHEMA.curie('type'),
+                   model_uri=REGISTRY_SCHEMA.Usage_type, domain=Usage, range=Optional[str])
+
+slots.Usage_description = Slot(uri=REGISTRY_SCHEMA.description, name="Usage_description", curie=REGISTRY_SCHEMA.curie('description'),
+                   model_uri=REGISTRY_SCHEMA.Usage_description, domain=Usage, range=str)
+
+slots.Usage_seeAlso = Slot(uri=REGISTRY_SCHEMA.seeAlso, name="Usage_seeAlso", curie=REGISTRY_SCHEMA.curie('seeAlso'),
+                   model_uri=REGISTRY_SCHEMA.Usage_seeAlso, domain=Usage, range=Optional[str])
+
+slots.Usage_examples = Slot(uri=REGISTRY_SCHEMA.examples, name="Usage_examples", curie=REGISTRY_SCHEMA.curie('examples'),
+                   model_uri=REGISTRY_SCHEMA.Usage_examples, domain=Usage, range=Optional[Union[Union[dict, Example], List[Union[dict, Example]]]])
+
+slots.Usage_publications = Slot(uri=REGISTRY_SCHEMA.publications, name="Usage_publications", curie=REGISTRY_SCHEMA.curie('publications'),
+                   model_uri=REGISTRY_SCHEMA.Usage_publications, domain=Usage, range=Optional[Union[Union[dict, Publication], List[Union[dict, Publication]]]])
+
+slots.RegistrySchema_aberowl_id = Slot(uri=REGISTRY_SCHEMA.aberowl_id, name="RegistrySchema_aberowl_id", curie=REGISTRY_SCHEMA.curie('aberowl_id'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_aberowl_id, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_activity_status = Slot(uri=REGISTRY_SCHEMA.activity_status, name="RegistrySchema_activity_status", curie=REGISTRY_SCHEMA.curie('activity_status'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_activity_status, domain=RegistrySchema, range=Union[str, "ActivityStatusOptions"])
+
+slots.RegistrySchema_alternative_prefix = Slot(uri=REGISTRY_SCHEMA.alternative_prefix, name="RegistrySchema_alternative_prefix", curie=REGISTRY_SCHEMA.curie('alternative_prefix'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_alternative_prefix, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_alternatePrefix = Slot(uri=REGISTRY_SCHEMA.alternatePrefix, name="RegistrySchema_alternatePrefix", curie=REGISTRY_SCHEMA.curie('alternatePrefix'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_alternatePrefix, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_alternativePrefix = Slot(uri=REGISTRY_SCHEMA.alternativePrefix, name="RegistrySchema_alternativePrefix", curie=REGISTRY_SCHEMA.curie('alternativePrefix'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_alternativePrefix, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_biosharing = Slot(uri=REGISTRY_SCHEMA.biosharing, name="RegistrySchema_biosharing", curie=REGISTRY_SCHEMA.curie('biosharing'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_biosharing, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_browsers = Slot(uri=REGISTRY_SCHEMA.browsers, name="RegistrySchema_browsers", curie=REGISTRY_SCHEMA.curie('browsers'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_browsers, domain=RegistrySchema, range=Optional[Union[Union[dict, Browser], List[Union[dict, Browser]]]])
+
+slots.RegistrySchema_build = Slot(uri=REGISTRY_SCHEMA.build, name="RegistrySchema_build", curie=REGISTRY_SCHEMA.curie('build'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_build, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_canonical = Slot(uri=REGISTRY_SCHEMA.canonical, name="RegistrySchema_canonical", curie=REGISTRY_SCHEMA.curie('canonical'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_canonical, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_contact = Slot(uri=REGISTRY_SCHEMA.contact, name="RegistrySchema_contact", curie=REGISTRY_SCHEMA.curie('contact'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_contact, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_created_with = Slot(uri=REGISTRY_SCHEMA.created_with, name="RegistrySchema_created_with", curie=REGISTRY_SCHEMA.curie('created_with'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_created_with, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_createdWith = Slot(uri=REGISTRY_SCHEMA.createdWith, name="RegistrySchema_createdWith", curie=REGISTRY_SCHEMA.curie('createdWith'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_createdWith, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_description = Slot(uri=REGISTRY_SCHEMA.description, name="RegistrySchema_description", curie=REGISTRY_SCHEMA.curie('description'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_description, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_dependencies = Slot(uri=REGISTRY_SCHEMA.dependencies, name="RegistrySchema_dependencies", curie=REGISTRY_SCHEMA.curie('dependencies'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_dependencies, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_development = Slot(uri=REGISTRY_SCHEMA.development, name="RegistrySchema_development", curie=REGISTRY_SCHEMA.curie('development'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_development, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_depicted_by = Slot(uri=REGISTRY_SCHEMA.depicted_by, name="RegistrySchema_depicted_by", curie=REGISTRY_SCHEMA.curie('depicted_by'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_depicted_by, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_documentation = Slot(uri=REGISTRY_SCHEMA.documentation, name="RegistrySchema_documentation", curie=REGISTRY_SCHEMA.curie('documentation'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_documentation, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_domain = Slot(uri=REGISTRY_SCHEMA.domain, name="RegistrySchema_domain", curie=REGISTRY_SCHEMA.curie('domain'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_domain, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_do_wiki = Slot(uri=REGISTRY_SCHEMA.do_wiki, name="RegistrySchema_do_wiki", curie=REGISTRY_SCHEMA.curie('do_wiki'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_do_wiki, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_DO_wiki = Slot(uri=REGISTRY_SCHEMA.DO_wiki, name="RegistrySchema_DO wiki", curie=REGISTRY_SCHEMA.curie('DO_wiki'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_DO_wiki, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_example_class = Slot(uri=REGISTRY_SCHEMA.example_class, name="RegistrySchema_example_class", curie=REGISTRY_SCHEMA.curie('example_class'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_example_class, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_exampleClass = Slot(uri=REGISTRY_SCHEMA.exampleClass, name="RegistrySchema_exampleClass", curie=REGISTRY_SCHEMA.curie('exampleClass'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_exampleClass, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_facebook = Slot(uri=REGISTRY_SCHEMA.facebook, name="RegistrySchema_facebook", curie=REGISTRY_SCHEMA.curie('facebook'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_facebook, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_funded_by = Slot(uri=REGISTRY_SCHEMA.funded_by, name="RegistrySchema_funded_by", curie=REGISTRY_SCHEMA.curie('funded_by'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_funded_by, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_google_plus = Slot(uri=REGISTRY_SCHEMA.google_plus, name="RegistrySchema_google_plus", curie=REGISTRY_SCHEMA.curie('google_plus'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_google_plus, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_homepage = Slot(uri=REGISTRY_SCHEMA.homepage, name="RegistrySchema_homepage", curie=REGISTRY_SCHEMA.curie('homepage'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_homepage, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_id = Slot(uri=REGISTRY_SCHEMA.id, name="RegistrySchema_id", curie=REGISTRY_SCHEMA.curie('id'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_id, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_in_foundry = Slot(uri=REGISTRY_SCHEMA.in_foundry, name="RegistrySchema_in_foundry", curie=REGISTRY_SCHEMA.curie('in_foundry'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_in_foundry, domain=RegistrySchema, range=Optional[Union[bool, Bool]])
+
+slots.RegistrySchema_in_foundry_order = Slot(uri=REGISTRY_SCHEMA.in_foundry_order, name="RegistrySchema_in_foundry_order", curie=REGISTRY_SCHEMA.curie('in_foundry_order'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_in_foundry_order, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_integration_server = Slot(uri=REGISTRY_SCHEMA.integration_server, name="RegistrySchema_integration_server", curie=REGISTRY_SCHEMA.curie('integration_server'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_integration_server, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_is_obsolete = Slot(uri=REGISTRY_SCHEMA.is_obsolete, name="RegistrySchema_is_obsolete", curie=REGISTRY_SCHEMA.curie('is_obsolete'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_is_obsolete, domain=RegistrySchema, range=Optional[Union[bool, Bool]])
+
+slots.RegistrySchema_jobs = Slot(uri=REGISTRY_SCHEMA.jobs, name="RegistrySchema_jobs", curie=REGISTRY_SCHEMA.curie('jobs'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_jobs, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_label = Slot(uri=REGISTRY_SCHEMA.label, name="RegistrySchema_label", curie=REGISTRY_SCHEMA.curie('label'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_label, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_layout = Slot(uri=REGISTRY_SCHEMA.layout, name="RegistrySchema_layout", curie=REGISTRY_SCHEMA.curie('layout'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_layout, domain=RegistrySchema, range=Union[str, "LayoutOptions"])
+
+slots.RegistrySchema_license = Slot(uri=REGISTRY_SCHEMA.license, name="RegistrySchema_license", curie=REGISTRY_SCHEMA.curie('license'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_license, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_mailing_list = Slot(uri=REGISTRY_SCHEMA.mailing_list, name="RegistrySchema_mailing_list", curie=REGISTRY_SCHEMA.curie('mailing_list'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_mailing_list, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_ontology_purl = Slot(uri=REGISTRY_SCHEMA.ontology_purl, name="RegistrySchema_ontology_purl", curie=REGISTRY_SCHEMA.curie('ontology_purl'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_ontology_purl, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_page = Slot(uri=REGISTRY_SCHEMA.page, name="RegistrySchema_page", curie=REGISTRY_SCHEMA.curie('page'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_page, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_preferred_prefix = Slot(uri=REGISTRY_SCHEMA.preferred_prefix, name="RegistrySchema_preferred_prefix", curie=REGISTRY_SCHEMA.curie('preferred_prefix'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_preferred_prefix, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_preferredPrefix = Slot(uri=REGISTRY_SCHEMA.preferredPrefix, name="RegistrySchema_preferredPrefix", curie=REGISTRY_SCHEMA.curie('preferredPrefix'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_preferredPrefix, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_products = Slot(uri=REGISTRY_SCHEMA.products, name="RegistrySchema_products", curie=REGISTRY_SCHEMA.curie('products'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_products, domain=RegistrySchema, range=Union[Union[dict, Product], List[Union[dict, Product]]])
+
+slots.RegistrySchema_publications = Slot(uri=REGISTRY_SCHEMA.publications, name="RegistrySchema_publications", curie=REGISTRY_SCHEMA.curie('publications'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_publications, domain=RegistrySchema, range=Optional[Union[Union[dict, Publication], List[Union[dict, Publication]]]])
+
+slots.RegistrySchema_redirects = Slot(uri=REGISTRY_SCHEMA.redirects, name="RegistrySchema_redirects", curie=REGISTRY_SCHEMA.curie('redirects'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_redirects, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_releases = Slot(uri=REGISTRY_SCHEMA.releases, name="RegistrySchema_releases", curie=REGISTRY_SCHEMA.curie('releases'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_releases, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_replaced_by = Slot(uri=REGISTRY_SCHEMA.replaced_by, name="RegistrySchema_replaced_by", curie=REGISTRY_SCHEMA.curie('replaced_by'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_replaced_by, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_repository = Slot(uri=REGISTRY_SCHEMA.repository, name="RegistrySchema_repository", curie=REGISTRY_SCHEMA.curie('repository'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_repository, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_review = Slot(uri=REGISTRY_SCHEMA.review, name="RegistrySchema_review", curie=REGISTRY_SCHEMA.curie('review'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_review, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_slack = Slot(uri=REGISTRY_SCHEMA.slack, name="RegistrySchema_slack", curie=REGISTRY_SCHEMA.curie('slack'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_slack, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_source = Slot(uri=REGISTRY_SCHEMA.source, name="RegistrySchema_source", curie=REGISTRY_SCHEMA.curie('source'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_source, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_source_url = Slot(uri=REGISTRY_SCHEMA.source_url, name="RegistrySchema_source_url", curie=REGISTRY_SCHEMA.curie('source_url'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_source_url, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_taxon = Slot(uri=REGISTRY_SCHEMA.taxon, name="RegistrySchema_taxon", curie=REGISTRY_SCHEMA.curie('taxon'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_taxon, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_termgenie = Slot(uri=REGISTRY_SCHEMA.termgenie, name="RegistrySchema_termgenie", curie=REGISTRY_SCHEMA.curie('termgenie'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_termgenie, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_title = Slot(uri=REGISTRY_SCHEMA.title, name="RegistrySchema_title", curie=REGISTRY_SCHEMA.curie('title'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_title, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_tracker = Slot(uri=REGISTRY_SCHEMA.tracker, name="RegistrySchema_tracker", curie=REGISTRY_SCHEMA.curie('tracker'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_tracker, domain=RegistrySchema, range=str)
+
+slots.RegistrySchema_ty = Slot(uri=REGISTRY_SCHEMA.ty, name="RegistrySchema_ty", curie=REGISTRY_SCHEMA.curie('ty'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_ty, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_type = Slot(uri=REGISTRY_SCHEMA.type, name="RegistrySchema_type", curie=REGISTRY_SCHEMA.curie('type'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_type, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_twitter = Slot(uri=REGISTRY_SCHEMA.twitter, name="RegistrySchema_twitter", curie=REGISTRY_SCHEMA.curie('twitter'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_twitter, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_usages = Slot(uri=REGISTRY_SCHEMA.usages, name="RegistrySchema_usages", curie=REGISTRY_SCHEMA.curie('usages'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_usages, domain=RegistrySchema, range=Optional[Union[Union[dict, Usage], List[Union[dict, Usage]]]])
+
+slots.RegistrySchema_used_by = Slot(uri=REGISTRY_SCHEMA.used_by, name="RegistrySchema_used_by", curie=REGISTRY_SCHEMA.curie('used_by'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_used_by, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_validate = Slot(uri=REGISTRY_SCHEMA.validate, name="RegistrySchema_validate", curie=REGISTRY_SCHEMA.curie('validate'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_validate, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_was_derived_from = Slot(uri=REGISTRY_SCHEMA.was_derived_from, name="RegistrySchema_was_derived_from", curie=REGISTRY_SCHEMA.curie('was_derived_from'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_was_derived_from, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_wasDerivedFrom = Slot(uri=REGISTRY_SCHEMA.wasDerivedFrom, name="RegistrySchema_wasDerivedFrom", curie=REGISTRY_SCHEMA.curie('wasDerivedFrom'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_wasDerivedFrom, domain=RegistrySchema, range=Optional[str])
+
+slots.RegistrySchema_wikidata_template = Slot(uri=REGISTRY_SCHEMA.wikidata_template, name="RegistrySchema_wikidata_template", curie=REGISTRY_SCHEMA.curie('wikidata_template'),
+                   model_uri=REGISTRY_SCHEMA.RegistrySchema_wikidata_template, domain=RegistrySchema, range=Optional[str])
\ No newline at end of file
@@ -0,0 +1,1220 @@
+# Auto generated from phenopackets.schema.yaml by pythongen.py version: 0.0.1
+# Generation date: 2026-10-15T22:39:14
+# Schema: phenopackets
+#
+# id: https://example.org/phenopackets
+# description:
+# license: https://creativecommons.org/publicdomain/zero/1.0/
+
+import dataclasses
+import re
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time
+)
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+
+from jsonasobj2 import (
+    JsonObj,
+    as_dict
+)
+from linkml_runtime.linkml_model.meta import (
+    EnumDefinition,
+    PermissibleValue,
+    PvFormulaOptions
+)
+from linkml_runtime.utils.curienamespace import CurieNamespace
+from linkml_runtime.utils.dataclass_extensions_376 import dataclasses_init_fn_with_kwargs
+from linkml_runtime.utils.enumerations import EnumDefinitionImpl
+from linkml_runtime.utils.formatutils import (
+    camelcase,
+    sfx,
+    underscore
+)
+from linkml_runtime.utils.metamodelcore import (
+    bnode,
+    empty_dict,
+    empty_list
+)
+from linkml_runtime.utils.slot import Slot
+from linkml_runtime.utils.yamlutils import (
+    YAMLRoot,
+    extended_float,
+    extended_int,
+    extended_str
+)
+from rdflib import (
+    Namespace,
+    URIRef
+)
+
+from linkml_runtime.linkml_model.types import Boolean, Integer, String
+from linkml_runtime.utils.metamodelcore import Bool
+
+metamodel_version = "1.7.0"
+version = None
+
+# Overwrite dataclasses _init_fn to add **kwargs in __init__
+dataclasses._init_fn = dataclasses_init_fn_with_kwargs
+
+# Namespaces
+LINKML = CurieNamespace('linkml', 'https://w3id.org/linkml/')
+PHENOPACKETS = CurieNamespace('phenopackets', 'https://example.org/phenopackets')
+DEFAULT_ = PHENOPACKETS
+
+
+# Types
+
+# Class references
+
+
+
+@dataclass(repr=False)
+class Age(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Age"]
+    class_class_curie: ClassVar[str] = "phenopackets:Age"
+    class_name: ClassVar[str] = "Age"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Age
+
+    age: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.age is not None and not isinstance(self.age, str):
+            self.age = str(self.age)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class OntologyClass(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["OntologyClass"]
+    class_class_curie: ClassVar[str] = "phenopackets:OntologyClass"
+    class_name: ClassVar[str] = "OntologyClass"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.OntologyClass
+
+    id: Optional[str] = None
+    label: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.label is not None and not isinstance(self.label, str):
+            self.label = str(self.label)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class AgeRange(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["AgeRange"]
+    class_class_curie: ClassVar[str] = "phenopackets:AgeRange"
+    class_name: ClassVar[str] = "AgeRange"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.AgeRange
+
+    start: Optional[Union[dict, Age]] = None
+    end: Optional[Union[dict, Age]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.start is not None and not isinstance(self.start, Age):
+            self.start = Age(**as_dict(self.start))
+
+        if self.end is not None and not isinstance(self.end, Age):
+            self.end = Age(**as_dict(self.end))
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Evidence(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Evidence"]
+    class_class_curie: ClassVar[str] = "phenopackets:Evidence"
+    class_name: ClassVar[str] = "Evidence"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Evidence
+
+    evidence_code: Optional[Union[dict, OntologyClass]] = None
+    reference: Optional[Union[dict, "ExternalReference"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.evidence_code is not None and not isinstance(self.evidence_code, OntologyClass):
+            self.evidence_code = OntologyClass(**as_dict(self.evidence_code))
+
+        if self.reference is not None and not isinstance(self.reference, ExternalReference):
+            self.reference = ExternalReference(**as_dict(self.reference))
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class PhenotypicFeature(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["PhenotypicFeature"]
+    class_class_curie: ClassVar[str] = "phenopackets:PhenotypicFeature"
+    class_name: ClassVar[str] = "PhenotypicFeature"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.PhenotypicFeature
+
+    description: Optional[str] = None
+    type: Optional[Union[dict, OntologyClass]] = None
+    negated: Optional[Union[bool, Bool]] = None
+    severity: Optional[Union[dict, OntologyClass]] = None
+    modifiers: Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]] = empty_list()
+    age_of_onset: Optional[Union[dict, Age]] = None
+    age_range_of_onset: Optional[Union[dict, AgeRange]] = None
+    class_of_onset: Optional[Union[dict, OntologyClass]] = None
+    evidence: Optional[Union[Union[dict, Evidence], List[Union[dict, Evidence]]]] = empty_list()
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.description is not None and not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if self.type is not None and not isinstance(self.type, OntologyClass):
+            self.type = OntologyClass(**as_dict(self.type))
+
+        if self.negated is not None and not isinstance(self.negated, Bool):
+            self.negated = Bool(self.negated)
+
+        if self.severity is not None and not isinstance(self.severity, OntologyClass):
+            self.severity = OntologyClass(**as_dict(self.severity))
+
+        if not isinstance(self.modifiers, list):
+            self.modifiers = [self.modifiers] if self.modifiers is not None else []
+        self.modifiers = [v if isinstance(v, OntologyClass) else OntologyClass(**as_dict(v)) for v in self.modifiers]
+
+        if self.age_of_onset is not None and not isinstance(self.age_of_onset, Age):
+            self.age_of_onset = Age(**as_dict(self.age_of_onset))
+
+        if self.age_range_of_onset is not None and not isinstance(self.age_range_of_onset, AgeRange):
+            self.age_range_of_onset = AgeRange(**as_dict(self.age_range_of_onset))
+
+        if self.class_of_onset is not None and not isinstance(self.class_of_onset, OntologyClass):
+            self.class_of_onset = OntologyClass(**as_dict(self.class_of_onset))
+
+        if not isinstance(self.evidence, list):
+            self.evidence = [self.evidence] if self.evidence is not None else []
+        self.evidence = [v if isinstance(v, Evidence) else Evidence(**as_dict(v)) for v in self.evidence]
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Variant(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Variant"]
+    class_class_curie: ClassVar[str] = "phenopackets:Variant"
+    class_name: ClassVar[str] = "Variant"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Variant
+
+    hgvs_allele: Optional[str] = None
+    vcf_allele: Optional[str] = None
+    spdi_allele: Optional[str] = None
+    iscn_allele: Optional[str] = None
+    zygosity: Optional[Union[dict, OntologyClass]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.hgvs_allele is not None and not isinstance(self.hgvs_allele, str):
+            self.hgvs_allele = str(self.hgvs_allele)
+
+        if self.vcf_allele is not None and not isinstance(self.vcf_allele, str):
+            self.vcf_allele = str(self.vcf_allele)
+
+        if self.spdi_allele is not None and not isinstance(self.spdi_allele, str):
+            self.spdi_allele = str(self.spdi_allele)
+
+        if self.iscn_allele is not None and not isinstance(self.iscn_allele, str):
+            self.iscn_allele = str(self.iscn_allele)
+
+        if self.zygosity is not None and not isinstance(self.zygosity, OntologyClass):
+            self.zygosity = OntologyClass(**as_dict(self.zygosity))
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class HtsFile(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["HtsFile"]
+    class_class_curie: ClassVar[str] = "phenopackets:HtsFile"
+    class_name: ClassVar[str] = "HtsFile"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.HtsFile
+
+    uri: Optional[str] = None
+    description: Optional[str] = None
+    hts_format: Optional[Union[str, "HtsFormatOptions"]] = None
+    genome_assembly: Optional[str] = None
+    individual_to_sample_identifiers: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.uri is not None and not isinstance(self.uri, str):
+            self.uri = str(self.uri)
+
+        if self.description is not None and not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if self.hts_format is not None and not isinstance(self.hts_format, HtsFormatOptions):
+            self.hts_format = HtsFormatOptions(self.hts_format)
+
+        if self.genome_assembly is not None and not isinstance(self.genome_assembly, str):
+            self.genome_assembly = str(self.genome_assembly)
+
+        if self.individual_to_sample_identifiers is not None and not isinstance(self.individual_to_sample_identifiers, str):
+            self.individual_to_sample_identifiers = str(self.individual_to_sample_identifiers)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Timestamp(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Timestamp"]
+    class_class_curie: ClassVar[str] = "phenopackets:Timestamp"
+    class_name: ClassVar[str] = "Timestamp"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Timestamp
+
+    seconds: Optional[int] = None
+    nanos: Optional[int] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.seconds is not None and not isinstance(self.seconds, int):
+            self.seconds = int(self.seconds)
+
+        if self.nanos is not None and not isinstance(self.nanos, int):
+            self.nanos = int(self.nanos)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class ExternalReference(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["ExternalReference"]
+    class_class_curie: ClassVar[str] = "phenopackets:ExternalReference"
+    class_name: ClassVar[str] = "ExternalReference"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.ExternalReference
+
+    id: Optional[str] = None
+    description: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.description is not None and not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Biosample(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Biosample"]
+    class_class_curie: ClassVar[str] = "phenopackets:Biosample"
+    class_name: ClassVar[str] = "Biosample"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Biosample
+
+    id: Optional[str] = None
+    individual_id: Optional[str] = None
+    description: Optional[str] = None
+    sampled_tissue: Optional[Union[dict, OntologyClass]] = None
+    phenotypic_features: Optional[Union[Union[dict, PhenotypicFeature], List[Union[dict, PhenotypicFeature]]]] = empty_list()
+    taxonomy: Optional[Union[dict, OntologyClass]] = None
+    age_of_individual_at_collection: Optional[Union[dict, Age]] = None
+    age_range_of_individual_at_collection: Optional[Union[dict, AgeRange]] = None
+    histological_diagnosis: Optional[Union[dict, OntologyClass]] = None
+    tumor_progression: Optional[Union[dict, OntologyClass]] = None
+    tumor_grade: Optional[Union[dict, OntologyClass]] = None
+    diagnostic_markers: Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]] = empty_list()
+    procedure: Optional[str] = None
+    hts_files: Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]] = empty_list()
+    variants: Optional[Union[Union[dict, Variant], List[Union[dict, Variant]]]] = empty_list()
+    is_control_sample: Optional[Union[bool, Bool]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.individual_id is not None and not isinstance(self.individual_id, str):
+            self.individual_id = str(self.individual_id)
+
+        if self.description is not None and not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if self.sampled_tissue is not None and not isinstance(self.sampled_tissue, OntologyClass):
+            self.sampled_tissue = OntologyClass(**as_dict(self.sampled_tissue))
+
+        if not isinstance(self.phenotypic_features, list):
+            self.phenotypic_features = [self.phenotypic_features] if self.phenotypic_features is not None else []
+        self.phenotypic_features = [v if isinstance(v, PhenotypicFeature) else PhenotypicFeature(**as_dict(v)) for v in self.phenotypic_features]
+
+        if self.taxonomy is not None and not isinstance(self.taxonomy, OntologyClass):
+            self.taxonomy = OntologyClass(**as_dict(self.taxonomy))
+
+        if self.age_of_individual_at_collection is not None and not isinstance(self.age_of_individual_at_collection, Age):
+            self.age_of_individual_at_collection = Age(**as_dict(self.age_of_individual_at_collection))
+
+        if self.age_range_of_individual_at_collection is not None and not isinstance(self.age_range_of_individual_at_collection, AgeRange):
+            self.age_range_of_individual_at_collection = AgeRange(**as_dict(self.age_range_of_individual_at_collection))
+
+        if self.histological_diagnosis is not None and not isinstance(self.histological_diagnosis, OntologyClass):
+            self.histological_diagnosis = OntologyClass(**as_dict(self.histological_diagnosis))
+
+        if self.tumor_progression is not None and not isinstance(self.tumor_progression, OntologyClass):
+            self.tumor_progression = OntologyClass(**as_dict(self.tumor_progression))
+
+        if self.tumor_grade is not None and not isinstance(self.tumor_grade, OntologyClass):
+            self.tumor_grade = OntologyClass(**as_dict(self.tumor_grade))
+
+        if not isinstance(self.diagnostic_markers, list):
+            self.diagnostic_markers = [self.diagnostic_markers] if self.diagnostic_markers is not None else []
+        self.diagnostic_markers = [v if isinstance(v, OntologyClass) else OntologyClass(**as_dict(v)) for v in self.diagnostic_markers]
+
+        if self.procedure is not None and not isinstance(self.procedure, str):
+            self.procedure = str(self.procedure)
+
+        if not isinstance(self.hts_files, list):
+            self.hts_files = [self.hts_files] if self.hts_files is not None else []
+        self.hts_files = [v if isinstance(v, HtsFile) else HtsFile(**as_dict(v)) for v in self.hts_files]
+
+        if not isinstance(self.variants, list):
+            self.variants = [self.variants] if self.variants is not None else []
+        self.variants = [v if isinstance(v, Variant) else Variant(**as_dict(v)) for v in self.variants]
+
+        if self.is_control_sample is not None and not isinstance(self.is_control_sample, Bool):
+            self.is_control_sample = Bool(self.is_control_sample)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Gene(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Gene"]
+    class_class_curie: ClassVar[str] = "phenopackets:Gene"
+    class_name: ClassVar[str] = "Gene"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Gene
+
+    id: Optional[str] = None
+    alternate_ids: Optional[Union[str, List[str]]] = empty_list()
+    symbol: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if not isinstance(self.alternate_ids, list):
+            self.alternate_ids = [self.alternate_ids] if self.alternate_ids is not None else []
+        self.alternate_ids = [v if isinstance(v, str) else str(v) for v in self.alternate_ids]
+
+        if self.symbol is not None and not isinstance(self.symbol, str):
+            self.symbol = str(self.symbol)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Disease(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Disease"]
+    class_class_curie: ClassVar[str] = "phenopackets:Disease"
+    class_name: ClassVar[str] = "Disease"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Disease
+
+    term: Optional[Union[dict, OntologyClass]] = None
+    age_of_onset: Optional[Union[dict, Age]] = None
+    age_range_of_onset: Optional[Union[dict, AgeRange]] = None
+    class_of_onset: Optional[Union[dict, OntologyClass]] = None
+    disease_stage: Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]] = empty_list()
+    tnm_finding: Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]] = empty_list()
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.term is not None and not isinstance(self.term, OntologyClass):
+            self.term = OntologyClass(**as_dict(self.term))
+
+        if self.age_of_onset is not None and not isinstance(self.age_of_onset, Age):
+            self.age_of_onset = Age(**as_dict(self.age_of_onset))
+
+        if self.age_range_of_onset is not None and not isinstance(self.age_range_of_onset, AgeRange):
+            self.age_range_of_onset = AgeRange(**as_dict(self.age_range_of_onset))
+
+        if self.class_of_onset is not None and not isinstance(self.class_of_onset, OntologyClass):
+            self.class_of_onset = OntologyClass(**as_dict(self.class_of_onset))
+
+        if not isinstance(self.disease_stage, list):
+            self.disease_stage = [self.disease_stage] if self.disease_stage is not None else []
+        self.disease_stage = [v if isinstance(v, OntologyClass) else OntologyClass(**as_dict(v)) for v in self.disease_stage]
+
+        if not isinstance(self.tnm_finding, list):
+            self.tnm_finding = [self.tnm_finding] if self.tnm_finding is not None else []
+        self.tnm_finding = [v if isinstance(v, OntologyClass) else OntologyClass(**as_dict(v)) for v in self.tnm_finding]
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Phenopacket(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Phenopacket"]
+    class_class_curie: ClassVar[str] = "phenopackets:Phenopacket"
+    class_name: ClassVar[str] = "Phenopacket"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Phenopacket
+
+    id: Optional[str] = None
+    subject: Optional[str] = None
+    phenotypic_features: Optional[Union[Union[dict, PhenotypicFeature], List[Union[dict, PhenotypicFeature]]]] = empty_list()
+    biosamples: Optional[Union[Union[dict, Biosample], List[Union[dict, Biosample]]]] = empty_list()
+    genes: Optional[Union[Union[dict, Gene], List[Union[dict, Gene]]]] = empty_list()
+    variants: Optional[Union[Union[dict, Variant], List[Union[dict, Variant]]]] = empty_list()
+    diseases: Optional[Union[Union[dict, Disease], List[Union[dict, Disease]]]] = empty_list()
+    hts_files: Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]] = empty_list()
+    meta_data: Optional[Union[dict, "MetaData"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.subject is not None and not isinstance(self.subject, str):
+            self.subject = str(self.subject)
+
+        if not isinstance(self.phenotypic_features, list):
+            self.phenotypic_features = [self.phenotypic_features] if self.phenotypic_features is not None else []
+        self.phenotypic_features = [v if isinstance(v, PhenotypicFeature) else PhenotypicFeature(**as_dict(v)) for v in self.phenotypic_features]
+
+        if not isinstance(self.biosamples, list):
+            self.biosamples = [self.biosamples] if self.biosamples is not None else []
+        self.biosamples = [v if isinstance(v, Biosample) else Biosample(**as_dict(v)) for v in self.biosamples]
+
+        if not isinstance(self.genes, list):
+            self.genes = [self.genes] if self.genes is not None else []
+        self.genes = [v if isinstance(v, Gene) else Gene(**as_dict(v)) for v in self.genes]
+
+        if not isinstance(self.variants, list):
+            self.variants = [self.variants] if self.variants is not None else []
+        self.variants = [v if isinstance(v, Variant) else Variant(**as_dict(v)) for v in self.variants]
+
+        if not isinstance(self.diseases, list):
+            self.diseases = [self.diseases] if self.diseases is not None else []
+        self.diseases = [v if isinstance(v, Disease) else Disease(**as_dict(v)) for v in self.diseases]
+
+        if not isinstance(self.hts_files, list):
+            self.hts_files = [self.hts_files] if self.hts_files is not None else []
+        self.hts_files = [v if isinstance(v, HtsFile) else HtsFile(**as_dict(v)) for v in self.hts_files]
+
+        if self.meta_data is not None and not isinstance(self.meta_data, MetaData):
+            self.meta_data = MetaData(**as_dict(self.meta_data))
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Resource(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Resource"]
+    class_class_curie: ClassVar[str] = "phenopackets:Resource"
+    class_name: ClassVar[str] = "Resource"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Resource
+
+    id: Optional[str] = None
+    name: Optional[str] = None
+    url: Optional[str] = None
+    version: Optional[str] = None
+    namespace_prefix: Optional[str] = None
+    iri_prefix: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.name is not None and not isinstance(self.name, str):
+            self.name = str(self.name)
+
+        if self.url is not None and not isinstance(self.url, str):
+            self.url = str(self.url)
+
+        if self.version is not None and not isinstance(self.version, str):
+            self.version = str(self.version)
+
+        if self.namespace_prefix is not None and not isinstance(self.namespace_prefix, str):
+            self.namespace_prefix = str(self.namespace_prefix)
+
+        if self.iri_prefix is not None and not isinstance(self.iri_prefix, str):
+            self.iri_prefix = str(self.iri_prefix)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Update(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Update"]
+    class_class_curie: ClassVar[str] = "phenopackets:Update"
+    class_name: ClassVar[str] = "Update"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Update
+
+    timestamp: Optional[Union[dict, Timestamp]] = None
+    updated_by: Optional[str] = None
+    comment: Optional[str] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.timestamp is not None and not isinstance(self.timestamp, Timestamp):
+            self.timestamp = Timestamp(**as_dict(self.timestamp))
+
+        if self.updated_by is not None and not isinstance(self.updated_by, str):
+            self.updated_by = str(self.updated_by)
+
+        if self.comment is not None and not isinstance(self.comment, str):
+            self.comment = str(self.comment)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class MetaData(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["MetaData"]
+    class_class_curie: ClassVar[str] = "phenopackets:MetaData"
+    class_name: ClassVar[str] = "MetaData"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.MetaData
+
+    created: Optional[Union[dict, Timestamp]] = None
+    created_by: Optional[str] = None
+    submitted_by: Optional[str] = None
+    resources: Optional[Union[Union[dict, Resource], List[Union[dict, Resource]]]] = empty_list()
+    updates: Optional[Union[Union[dict, Update], List[Union[dict, Update]]]] = empty_list()
+    phenopacket_schema_version: Optional[str] = None
+    external_references: Optional[Union[Union[dict, ExternalReference], List[Union[dict, ExternalReference]]]] = empty_list()
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.created is not None and not isinstance(self.created, Timestamp):
+            self.created = Timestamp(**as_dict(self.created))
+
+        if self.created_by is not None and not isinstance(self.created_by, str):
+            self.created_by = str(self.created_by)
+
+        if self.submitted_by is not None and not isinstance(self.submitted_by, str):
+            self.submitted_by = str(self.submitted_by)
+
+        if not isinstance(self.resources, list):
+            self.resources = [self.resources] if self.resources is not None else []
+        self.resources = [v if isinstance(v, Resource) else Resource(**as_dict(v)) for v in self.resources]
+
+        if not isinstance(self.updates, list):
+            self.updates = [self.updates] if self.updates is not None else []
+        self.updates = [v if isinstance(v, Update) else Update(**as_dict(v)) for v in self.updates]
+
+        if self.phenopacket_schema_version is not None and not isinstance(self.phenopacket_schema_version, str):
+            self.phenopacket_schema_version = str(self.phenopacket_schema_version)
+
+        if not isinstance(self.external_references, list):
+            self.external_references = [self.external_references] if self.external_references is not None else []
+        self.external_references = [v if isinstance(v, ExternalReference) else ExternalReference(**as_dict(v)) for v in self.external_references]
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Family(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Family"]
+    class_class_curie: ClassVar[str] = "phenopackets:Family"
+    class_name: ClassVar[str] = "Family"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Family
+
+    id: Optional[str] = None
+    proband: Optional[Union[dict, Phenopacket]] = None
+    relatives: Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]] = empty_list()
+    pedigree: Optional[str] = None
+    hts_files: Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]] = empty_list()
+    meta_data: Optional[Union[dict, MetaData]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.proband is not None and not isinstance(self.proband, Phenopacket):
+            self.proband = Phenopacket(**as_dict(self.proband))
+
+        if not isinstance(self.relatives, list):
+            self.relatives = [self.relatives] if self.relatives is not None else []
+        self.relatives = [v if isinstance(v, Phenopacket) else Phenopacket(**as_dict(v)) for v in self.relatives]
+
+        if self.pedigree is not None and not isinstance(self.pedigree, str):
+            self.pedigree = str(self.pedigree)
+
+        if not isinstance(self.hts_files, list):
+            self.hts_files = [self.hts_files] if self.hts_files is not None else []
+        self.hts_files = [v if isinstance(v, HtsFile) else HtsFile(**as_dict(v)) for v in self.hts_files]
+
+        if self.meta_data is not None and not isinstance(self.meta_data, MetaData):
+            self.meta_data = MetaData(**as_dict(self.meta_data))
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Cohort(YAMLRoot):
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = PHENOPACKETS["Cohort"]
+    class_class_curie: ClassVar[str] = "phenopackets:Cohort"
+    class_name: ClassVar[str] = "Cohort"
+    class_model_uri: ClassVar[URIRef] = PHENOPACKETS.Cohort
+
+    id: Optional[str] = None
+    description: Optional[str] = None
+    members: Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]] = empty_list()
+    hts_files: Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]] = empty_list()
+    meta_data: Optional[Union[dict, MetaData]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self.id is not None and not isinstance(self.id, str):
+            self.id = str(self.id)
+
+        if self.description is not None and not isinstance(self.description, str):
+            self.description = str(self.description)
+
+        if not isinstance(self.members, list):
+            self.members = [self.members] if self.members is not None else []
+        self.members = [v if isinstance(v, Phenopacket) else Phenopacket(**as_dict(v)) for v in self.members]
+
+        if not isinstance(self.hts_files, list):
+            self.hts_files = [self.hts_files] if self.hts_files is not None else []
+        self.hts_files = [v if isinstance(v, HtsFile) else HtsFile(**as_dict(v)) for v in self.hts_files]
+
+        if self.meta_data is not None and not isinstance(self.meta_data, MetaData):
+            self.meta_data = MetaData(**as_dict(self.meta_data))
+
+        super().__post_init__(**kwargs)
+
+
+# Enumerations
+class HtsFormatOptions(EnumDefinitionImpl):
+
+    UNKNOWN = PermissibleValue(text="UNKNOWN")
+    SAM = PermissibleValue(text="SAM")
+    BAM = PermissibleValue(text="BAM")
+    CRAM = PermissibleValue(text="CRAM")
+    VCF = PermissibleValue(text="VCF")
+    BCF = PermissibleValue(text="BCF")
+    GVCF = PermissibleValue(text="GVCF")
+    FASTQ = PermissibleValue(text="FASTQ")
+
+    _defn = EnumDefinition(
+        name="HtsFormatOptions",
+    )
+
+# Slots
+class slots:
+    pass
+
+slots.age = Slot(uri=PHENOPACKETS.age, name="age", curie=PHENOPACKETS.curie('age'),
+                   model_uri=PHENOPACKETS.age, domain=None, range=Optional[str])
+
+slots.id = Slot(uri=PHENOPACKETS.id, name="id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.id, domain=None, range=Optional[str])
+
+slots.label = Slot(uri=PHENOPACKETS.label, name="label", curie=PHENOPACKETS.curie('label'),
+                   model_uri=PHENOPACKETS.label, domain=None, range=Optional[str])
+
+slots.start = Slot(uri=PHENOPACKETS.start, name="start", curie=PHENOPACKETS.curie('start'),
+                   model_uri=PHENOPACKETS.start, domain=None, range=Optional[Union[dict, Age]])
+
+slots.end = Slot(uri=PHENOPACKETS.end, name="end", curie=PHENOPACKETS.curie('end'),
+                   model_uri=PHENOPACKETS.end, domain=None, range=Optional[Union[dict, Age]])
+
+slots.description = Slot(uri=PHENOPACKETS.description, name="description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.description, domain=None, range=Optional[str])
+
+slots.type = Slot(uri=PHENOPACKETS.type, name="type", curie=PHENOPACKETS.curie('type'),
+                   model_uri=PHENOPACKETS.type, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.negated = Slot(uri=PHENOPACKETS.negated, name="negated", curie=PHENOPACKETS.curie('negated'),
+                   model_uri=PHENOPACKETS.negated, domain=None, range=Optional[Union[bool, Bool]])
+
+slots.severity = Slot(uri=PHENOPACKETS.severity, name="severity", curie=PHENOPACKETS.curie('severity'),
+                   model_uri=PHENOPACKETS.severity, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.modifiers = Slot(uri=PHENOPACKETS.modifiers, name="modifiers", curie=PHENOPACKETS.curie('modifiers'),
+                   model_uri=PHENOPACKETS.modifiers, domain=None, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.age_of_onset = Slot(uri=PHENOPACKETS.age_of_onset, name="age_of_onset", curie=PHENOPACKETS.curie('age_of_onset'),
+                   model_uri=PHENOPACKETS.age_of_onset, domain=None, range=Optional[Union[dict, Age]])
+
+slots.age_range_of_onset = Slot(uri=PHENOPACKETS.age_range_of_onset, name="age_range_of_onset", curie=PHENOPACKETS.curie('age_range_of_onset'),
+                   model_uri=PHENOPACKETS.age_range_of_onset, domain=None, range=Optional[Union[dict, AgeRange]])
+
+slots.class_of_onset = Slot(uri=PHENOPACKETS.class_of_onset, name="class_of_onset", curie=PHENOPACKETS.curie('class_of_onset'),
+                   model_uri=PHENOPACKETS.class_of_onset, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.evidence_code = Slot(uri=PHENOPACKETS.evidence_code, name="evidence_code", curie=PHENOPACKETS.curie('evidence_code'),
+                   model_uri=PHENOPACKETS.evidence_code, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.reference = Slot(uri=PHENOPACKETS.reference, name="reference", curie=PHENOPACKETS.curie('reference'),
+                   model_uri=PHENOPACKETS.reference, domain=None, range=Optional[Union[dict, ExternalReference]])
+
+slots.evidence = Slot(uri=PHENOPACKETS.evidence, name="evidence", curie=PHENOPACKETS.curie('evidence'),
+                   model_uri=PHENOPACKETS.evidence, domain=None, range=Optional[Union[Union[dict, Evidence], List[Union[dict, Evidence]]]])
+
+slots.hgvs_allele = Slot(uri=PHENOPACKETS.hgvs_allele, name="hgvs_allele", curie=PHENOPACKETS.curie('hgvs_allele'),
+                   model_uri=PHENOPACKETS.hgvs_allele, domain=None, range=Optional[str])
+
+slots.vcf_allele = Slot(uri=PHENOPACKETS.vcf_allele, name="vcf_allele", curie=PHENOPACKETS.curie('vcf_allele'),
+                   model_uri=PHENOPACKETS.vcf_allele, domain=None, range=Optional[str])
+
+slots.spdi_allele = Slot(uri=PHENOPACKETS.spdi_allele, name="spdi_allele", curie=PHENOPACKETS.curie('spdi_allele'),
+                   model_uri=PHENOPACKETS.spdi_allele, domain=None, range=Optional[str])
+
+slots.iscn_allele = Slot(uri=PHENOPACKETS.iscn_allele, name="iscn_allele", curie=PHENOPACKETS.curie('iscn_allele'),
+                   model_uri=PHENOPACKETS.iscn_allele, domain=None, range=Optional[str])
+
+slots.zygosity = Slot(uri=PHENOPACKETS.zygosity, name="zygosity", curie=PHENOPACKETS.curie('zygosity'),
+                   model_uri=PHENOPACKETS.zygosity, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.uri = Slot(uri=PHENOPACKETS.uri, name="uri", curie=PHENOPACKETS.curie('uri'),
+                   model_uri=PHENOPACKETS.uri, domain=None, range=Optional[str])
+
+slots.hts_format = Slot(uri=PHENOPACKETS.hts_format, name="hts_format", curie=PHENOPACKETS.curie('hts_format'),
+                   model_uri=PHENOPACKETS.hts_format, domain=None, range=Optional[Union[str, "HtsFormatOptions"]])
+
+slots.genome_assembly = Slot(uri=PHENOPACKETS.genome_assembly, name="genome_assembly", curie=PHENOPACKETS.curie('genome_assembly'),
+                   model_uri=PHENOPACKETS.genome_assembly, domain=None, range=Optional[str])
+
+slots.individual_to_sample_identifiers = Slot(uri=PHENOPACKETS.individual_to_sample_identifiers, name="individual_to_sample_identifiers", curie=PHENOPACKETS.curie('individual_to_sample_identifiers'),
+                   model_uri=PHENOPACKETS.individual_to_sample_identifiers, domain=None, range=Optional[str])
+
+slots.seconds = Slot(uri=PHENOPACKETS.seconds, name="seconds", curie=PHENOPACKETS.curie('seconds'),
+                   model_uri=PHENOPACKETS.seconds, domain=None, range=Optional[int])
+
+slots.nanos = Slot(uri=PHENOPACKETS.nanos, name="nanos", curie=PHENOPACKETS.curie('nanos'),
+                   model_uri=PHENOPACKETS.nanos, domain=None, range=Optional[int])
+
+slots.subject = Slot(uri=PHENOPACKETS.subject, name="subject", curie=PHENOPACKETS.curie('subject'),
+                   model_uri=PHENOPACKETS.subject, domain=None, range=Optional[str])
+
+slots.phenotypic_features = Slot(uri=PHENOPACKETS.phenotypic_features, name="phenotypic_features", curie=PHENOPACKETS.curie('phenotypic_features'),
+                   model_uri=PHENOPACKETS.phenotypic_features, domain=None, range=Optional[Union[Union[dict, PhenotypicFeature], List[Union[dict, PhenotypicFeature]]]])
+
+slots.individual_id = Slot(uri=PHENOPACKETS.individual_id, name="individual_id", curie=PHENOPACKETS.curie('individual_id'),
+                   model_uri=PHENOPACKETS.individual_id, domain=None, range=Optional[str])
+
+slots.sampled_tissue = Slot(uri=PHENOPACKETS.sampled_tissue, name="sampled_tissue", curie=PHENOPACKETS.curie('sampled_tissue'),
+                   model_uri=PHENOPACKETS.sampled_tissue, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.taxonomy = Slot(uri=PHENOPACKETS.taxonomy, name="taxonomy", curie=PHENOPACKETS.curie('taxonomy'),
+                   model_uri=PHENOPACKETS.taxonomy, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.age_of_individual_at_collection = Slot(uri=PHENOPACKETS.age_of_individual_at_collection, name="age_of_individual_at_collection", curie=PHENOPACKETS.curie('age_of_individual_at_collection'),
+                   model_uri=PHENOPACKETS.age_of_individual_at_collection, domain=None, range=Optional[Union[dict, Age]])
+
+slots.age_range_of_individual_at_collection = Slot(uri=PHENOPACKETS.age_range_of_individual_at_collection, name="age_range_of_individual_at_collection", curie=PHENOPACKETS.curie('age_range_of_individual_at_collection'),
+                   model_uri=PHENOPACKETS.age_range_of_individual_at_collection, domain=None, range=Optional[Union[dict, AgeRange]])
+
+slots.histological_diagnosis = Slot(uri=PHENOPACKETS.histological_diagnosis, name="histological_diagnosis", curie=PHENOPACKETS.curie('histological_diagnosis'),
+                   model_uri=PHENOPACKETS.histological_diagnosis, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.tumor_progression = Slot(uri=PHENOPACKETS.tumor_progression, name="tumor_progression", curie=PHENOPACKETS.curie('tumor_progression'),
+                   model_uri=PHENOPACKETS.tumor_progression, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.tumor_grade = Slot(uri=PHENOPACKETS.tumor_grade, name="tumor_grade", curie=PHENOPACKETS.curie('tumor_grade'),
+                   model_uri=PHENOPACKETS.tumor_grade, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.diagnostic_markers = Slot(uri=PHENOPACKETS.diagnostic_markers, name="diagnostic_markers", curie=PHENOPACKETS.curie('diagnostic_markers'),
+                   model_uri=PHENOPACKETS.diagnostic_markers, domain=None, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.procedure = Slot(uri=PHENOPACKETS.procedure, name="procedure", curie=PHENOPACKETS.curie('procedure'),
+                   model_uri=PHENOPACKETS.procedure, domain=None, range=Optional[str])
+
+slots.hts_files = Slot(uri=PHENOPACKETS.hts_files, name="hts_files", curie=PHENOPACKETS.curie('hts_files'),
+                   model_uri=PHENOPACKETS.hts_files, domain=None, range=Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]])
+
+slots.variants = Slot(uri=PHENOPACKETS.variants, name="variants", curie=PHENOPACKETS.curie('variants'),
+                   model_uri=PHENOPACKETS.variants, domain=None, range=Optional[Union[Union[dict, Variant], List[Union[dict, Variant]]]])
+
+slots.is_control_sample = Slot(uri=PHENOPACKETS.is_control_sample, name="is_control_sample", curie=PHENOPACKETS.curie('is_control_sample'),
+                   model_uri=PHENOPACKETS.is_control_sample, domain=None, range=Optional[Union[bool, Bool]])
+
+slots.biosamples = Slot(uri=PHENOPACKETS.biosamples, name="biosamples", curie=PHENOPACKETS.curie('biosamples'),
+                   model_uri=PHENOPACKETS.biosamples, domain=None, range=Optional[Union[Union[dict, Biosample], List[Union[dict, Biosample]]]])
+
+slots.alternate_ids = Slot(uri=PHENOPACKETS.alternate_ids, name="alternate_ids", curie=PHENOPACKETS.curie('alternate_ids'),
+                   model_uri=PHENOPACKETS.alternate_ids, domain=None, range=Optional[Union[str, List[str]]])
+
+slots.symbol = Slot(uri=PHENOPACKETS.symbol, name="symbol", curie=PHENOPACKETS.curie('symbol'),
+                   model_uri=PHENOPACKETS.symbol, domain=None, range=Optional[str])
+
+slots.genes = Slot(uri=PHENOPACKETS.genes, name="genes", curie=PHENOPACKETS.curie('genes'),
+                   model_uri=PHENOPACKETS.genes, domain=None, range=Optional[Union[Union[dict, Gene], List[Union[dict, Gene]]]])
+
+slots.term = Slot(uri=PHENOPACKETS.term, name="term", curie=PHENOPACKETS.curie('term'),
+                   model_uri=PHENOPACKETS.term, domain=None, range=Optional[Union[dict, OntologyClass]])
+
+slots.disease_stage = Slot(uri=PHENOPACKETS.disease_stage, name="disease_stage", curie=PHENOPACKETS.curie('disease_stage'),
+                   model_uri=PHENOPACKETS.disease_stage, domain=None, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.tnm_finding = Slot(uri=PHENOPACKETS.tnm_finding, name="tnm_finding", curie=PHENOPACKETS.curie('tnm_finding'),
+                   model_uri=PHENOPACKETS.tnm_finding, domain=None, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.diseases = Slot(uri=PHENOPACKETS.diseases, name="diseases", curie=PHENOPACKETS.curie('diseases'),
+                   model_uri=PHENOPACKETS.diseases, domain=None, range=Optional[Union[Union[dict, Disease], List[Union[dict, Disease]]]])
+
+slots.meta_data = Slot(uri=PHENOPACKETS.meta_data, name="meta_data", curie=PHENOPACKETS.curie('meta_data'),
+                   model_uri=PHENOPACKETS.meta_data, domain=None, range=Optional[Union[dict, MetaData]])
+
+slots.created = Slot(uri=PHENOPACKETS.created, name="created", curie=PHENOPACKETS.curie('created'),
+                   model_uri=PHENOPACKETS.created, domain=None, range=Optional[Union[dict, Timestamp]])
+
+slots.created_by = Slot(uri=PHENOPACKETS.created_by, name="created_by", curie=PHENOPACKETS.curie('created_by'),
+                   model_uri=PHENOPACKETS.created_by, domain=None, range=Optional[str])
+
+slots.submitted_by = Slot(uri=PHENOPACKETS.submitted_by, name="submitted_by", curie=PHENOPACKETS.curie('submitted_by'),
+                   model_uri=PHENOPACKETS.submitted_by, domain=None, range=Optional[str])
+
+slots.name = Slot(uri=PHENOPACKETS.name, name="name", curie=PHENOPACKETS.curie('name'),
+                   model_uri=PHENOPACKETS.name, domain=None, range=Optional[str])
+
+slots.url = Slot(uri=PHENOPACKETS.url, name="url", curie=PHENOPACKETS.curie('url'),
+                   model_uri=PHENOPACKETS.url, domain=None, range=Optional[str])
+
+slots.version = Slot(uri=PHENOPACKETS.version, name="version", curie=PHENOPACKETS.curie('version'),
+                   model_uri=PHENOPACKETS.version, domain=None, range=Optional[str])
+
+slots.namespace_prefix = Slot(uri=PHENOPACKETS.namespace_prefix, name="namespace_prefix", curie=PHENOPACKETS.curie('namespace_prefix'),
+                   model_uri=PHENOPACKETS.namespace_prefix, domain=None, range=Optional[str])
+
+slots.iri_prefix = Slot(uri=PHENOPACKETS.iri_prefix, name="iri_prefix", curie=PHENOPACKETS.curie('iri_prefix'),
+                   model_uri=PHENOPACKETS.iri_prefix, domain=None, range=Optional[str])
+
+slots.resources = Slot(uri=PHENOPACKETS.resources, name="resources", curie=PHENOPACKETS.curie('resources'),
+                   model_uri=PHENOPACKETS.resources, domain=None, range=Optional[Union[Union[dict, Resource], List[Union[dict, Resource]]]])
+
+slots.timestamp = Slot(uri=PHENOPACKETS.timestamp, name="timestamp", curie=PHENOPACKETS.curie('timestamp'),
+                   model_uri=PHENOPACKETS.timestamp, domain=None, range=Optional[Union[dict, Timestamp]])
+
+slots.updated_by = Slot(uri=PHENOPACKETS.updated_by, name="updated_by", curie=PHENOPACKETS.curie('updated_by'),
+                   model_uri=PHENOPACKETS.updated_by, domain=None, range=Optional[str])
+
+slots.comment = Slot(uri=PHENOPACKETS.comment, name="comment", curie=PHENOPACKETS.curie('comment'),
+                   model_uri=PHENOPACKETS.comment, domain=None, range=Optional[str])
+
+slots.updates = Slot(uri=PHENOPACKETS.updates, name="updates", curie=PHENOPACKETS.curie('updates'),
+                   model_uri=PHENOPACKETS.updates, domain=None, range=Optional[Union[Union[dict, Update], List[Union[dict, Update]]]])
+
+slots.phenopacket_schema_version = Slot(uri=PHENOPACKETS.phenopacket_schema_version, name="phenopacket_schema_version", curie=PHENOPACKETS.curie('phenopacket_schema_version'),
+                   model_uri=PHENOPACKETS.phenopacket_schema_version, domain=None, range=Optional[str])
+
+slots.external_references = Slot(uri=PHENOPACKETS.external_references, name="external_references", curie=PHENOPACKETS.curie('external_references'),
+                   model_uri=PHENOPACKETS.external_references, domain=None, range=Optional[Union[Union[dict, ExternalReference], List[Union[dict, ExternalReference]]]])
+
+slots.proband = Slot(uri=PHENOPACKETS.proband, name="proband", curie=PHENOPACKETS.curie('proband'),
+                   model_uri=PHENOPACKETS.proband, domain=None, range=Optional[Union[dict, Phenopacket]])
+
+slots.relatives = Slot(uri=PHENOPACKETS.relatives, name="relatives", curie=PHENOPACKETS.curie('relatives'),
+                   model_uri=PHENOPACKETS.relatives, domain=None, range=Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]])
+
+slots.pedigree = Slot(uri=PHENOPACKETS.pedigree, name="pedigree", curie=PHENOPACKETS.curie('pedigree'),
+                   model_uri=PHENOPACKETS.pedigree, domain=None, range=Optional[str])
+
+slots.members = Slot(uri=PHENOPACKETS.members, name="members", curie=PHENOPACKETS.curie('members'),
+                   model_uri=PHENOPACKETS.members, domain=None, range=Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]])
+
+slots.Age_age = Slot(uri=PHENOPACKETS.age, name="Age_age", curie=PHENOPACKETS.curie('age'),
+                   model_uri=PHENOPACKETS.Age_age, domain=Age, range=Optional[str])
+
+slots.OntologyClass_id = Slot(uri=PHENOPACKETS.id, name="OntologyClass_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.OntologyClass_id, domain=OntologyClass, range=Optional[str])
+
+slots.OntologyClass_label = Slot(uri=PHENOPACKETS.label, name="OntologyClass_label", curie=PHENOPACKETS.curie('label'),
+                   model_uri=PHENOPACKETS.OntologyClass_label, domain=OntologyClass, range=Optional[str])
+
+slots.AgeRange_start = Slot(uri=PHENOPACKETS.start, name="AgeRange_start", curie=PHENOPACKETS.curie('start'),
+                   model_uri=PHENOPACKETS.AgeRange_start, domain=AgeRange, range=Optional[Union[dict, Age]])
+
+slots.AgeRange_end = Slot(uri=PHENOPACKETS.end, name="AgeRange_end", curie=PHENOPACKETS.curie('end'),
+                   model_uri=PHENOPACKETS.AgeRange_end, domain=AgeRange, range=Optional[Union[dict, Age]])
+
+slots.Evidence_evidence_code = Slot(uri=PHENOPACKETS.evidence_code, name="Evidence_evidence_code", curie=PHENOPACKETS.curie('evidence_code'),
+                   model_uri=PHENOPACKETS.Evidence_evidence_code, domain=Evidence, range=Optional[Union[dict, OntologyClass]])
+
+slots.Evidence_reference = Slot(uri=PHENOPACKETS.reference, name="Evidence_reference", curie=PHENOPACKETS.curie('reference'),
+                   model_uri=PHENOPACKETS.Evidence_reference, domain=Evidence, range=Optional[Union[dict, "ExternalReference"]])
+
+slots.PhenotypicFeature_description = Slot(uri=PHENOPACKETS.description, name="PhenotypicFeature_description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_description, domain=PhenotypicFeature, range=Optional[str])
+
+slots.PhenotypicFeature_type = Slot(uri=PHENOPACKETS.type, name="PhenotypicFeature_type", curie=PHENOPACKETS.curie('type'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_type, domain=PhenotypicFeature, range=Optional[Union[dict, OntologyClass]])
+
+slots.PhenotypicFeature_negated = Slot(uri=PHENOPACKETS.negated, name="PhenotypicFeature_negated", curie=PHENOPACKETS.curie('negated'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_negated, domain=PhenotypicFeature, range=Optional[Union[bool, Bool]])
+
+slots.PhenotypicFeature_severity = Slot(uri=PHENOPACKETS.severity, name="PhenotypicFeature_severity", curie=PHENOPACKETS.curie('severity'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_severity, domain=PhenotypicFeature, range=Optional[Union[dict, OntologyClass]])
+
+slots.PhenotypicFeature_modifiers = Slot(uri=PHENOPACKETS.modifiers, name="PhenotypicFeature_modifiers", curie=PHENOPACKETS.curie('modifiers'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_modifiers, domain=PhenotypicFeature, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.PhenotypicFeature_age_of_onset = Slot(uri=PHENOPACKETS.age_of_onset, name="PhenotypicFeature_age_of_onset", curie=PHENOPACKETS.curie('age_of_onset'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_age_of_onset, domain=PhenotypicFeature, range=Optional[Union[dict, Age]])
+
+slots.PhenotypicFeature_age_range_of_onset = Slot(uri=PHENOPACKETS.age_range_of_onset, name="PhenotypicFeature_age_range_of_onset", curie=PHENOPACKETS.curie('age_range_of_onset'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_age_range_of_onset, domain=PhenotypicFeature, range=Optional[Union[dict, AgeRange]])
+
+slots.PhenotypicFeature_class_of_onset = Slot(uri=PHENOPACKETS.class_of_onset, name="PhenotypicFeature_class_of_onset", curie=PHENOPACKETS.curie('class_of_onset'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_class_of_onset, domain=PhenotypicFeature, range=Optional[Union[dict, OntologyClass]])
+
+slots.PhenotypicFeature_evidence = Slot(uri=PHENOPACKETS.evidence, name="PhenotypicFeature_evidence", curie=PHENOPACKETS.curie('evidence'),
+                   model_uri=PHENOPACKETS.PhenotypicFeature_evidence, domain=PhenotypicFeature, range=Optional[Union[Union[dict, Evidence], List[Union[dict, Evidence]]]])
+
+slots.Variant_hgvs_allele = Slot(uri=PHENOPACKETS.hgvs_allele, name="Variant_hgvs_allele", curie=PHENOPACKETS.curie('hgvs_allele'),
+                   model_uri=PHENOPACKETS.Variant_hgvs_allele, domain=Variant, range=Optional[str])
+
+slots.Variant_vcf_allele = Slot(uri=PHENOPACKETS.vcf_allele, name="Variant_vcf_allele", curie=PHENOPACKETS.curie('vcf_allele'),
+                   model_uri=PHENOPACKETS.Variant_vcf_allele, domain=Variant, range=Optional[str])
+
+slots.Variant_spdi_allele = Slot(uri=PHENOPACKETS.spdi_allele, name="Variant_spdi_allele", curie=PHENOPACKETS.curie('spdi_allele'),
+                   model_uri=PHENOPACKETS.Variant_spdi_allele, domain=Variant, range=Optional[str])
+
+slots.Variant_iscn_allele = Slot(uri=PHENOPACKETS.iscn_allele, name="Variant_iscn_allele", curie=PHENOPACKETS.curie('iscn_allele'),
+                   model_uri=PHENOPACKETS.Variant_iscn_allele, domain=Variant, range=Optional[str])
+
+slots.Variant_zygosity = Slot(uri=PHENOPACKETS.zygosity, name="Variant_zygosity", curie=PHENOPACKETS.curie('zygosity'),
+                   model_uri=PHENOPACKETS.Variant_zygosity, domain=Variant, range=Optional[Union[dict, OntologyClass]])
+
+slots.HtsFile_uri = Slot(uri=PHENOPACKETS.uri, name="HtsFile_uri", curie=PHENOPACKETS.curie('uri'),
+                   model_uri=PHENOPACKETS.HtsFile_uri, domain=HtsFile, range=Optional[str])
+
+slots.HtsFile_description = Slot(uri=PHENOPACKETS.description, name="HtsFile_description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.HtsFile_description, domain=HtsFile, range=Optional[str])
+
+slots.HtsFile_hts_format = Slot(uri=PHENOPACKETS.hts_format, name="HtsFile_hts_format", curie=PHENOPACKETS.curie('hts_format'),
+                   model_uri=PHENOPACKETS.HtsFile_hts_format, domain=HtsFile, range=Optional[Union[str, "HtsFormatOptions"]])
+
+slots.HtsFile_genome_assembly = Slot(uri=PHENOPACKETS.genome_assembly, name="HtsFile_genome_assembly", curie=PHENOPACKETS.curie('genome_assembly'),
+                   model_uri=PHENOPACKETS.HtsFile_genome_assembly, domain=HtsFile, range=Optional[str])
+
+slots.HtsFile_individual_to_sample_identifiers = Slot(uri=PHENOPACKETS.individual_to_sample_identifiers, name="HtsFile_individual_to_sample_identifiers", curie=PHENOPACKETS.curie('individual_to_sample_identifiers'),
+                   model_uri=PHENOPACKETS.HtsFile_individual_to_sample_identifiers, domain=HtsFile, range=Optional[str])
+
+slots.Timestamp_seconds = Slot(uri=PHENOPACKETS.seconds, name="Timestamp_seconds", curie=PHENOPACKETS.curie('seconds'),
+                   model_uri=PHENOPACKETS.Timestamp_seconds, domain=Timestamp, range=Optional[int])
+
+slots.Timestamp_nanos = Slot(uri=PHENOPACKETS.nanos, name="Timestamp_nanos", curie=PHENOPACKETS.curie('nanos'),
+                   model_uri=PHENOPACKETS.Timestamp_nanos, domain=Timestamp, range=Optional[int])
+
+slots.ExternalReference_id = Slot(uri=PHENOPACKETS.id, name="ExternalReference_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.ExternalReference_id, domain=ExternalReference, range=Optional[str])
+
+slots.ExternalReference_description = Slot(uri=PHENOPACKETS.description, name="ExternalReference_description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.ExternalReference_description, domain=ExternalReference, range=Optional[str])
+
+slots.Biosample_id = Slot(uri=PHENOPACKETS.id, name="Biosample_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Biosample_id, domain=Biosample, range=Optional[str])
+
+slots.Biosample_individual_id = Slot(uri=PHENOPACKETS.individual_id, name="Biosample_individual_id", curie=PHENOPACKETS.curie('individual_id'),
+                   model_uri=PHENOPACKETS.Biosample_individual_id, domain=Biosample, range=Optional[str])
+
+slots.Biosample_description = Slot(uri=PHENOPACKETS.description, name="Biosample_description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.Biosample_description, domain=Biosample, range=Optional[str])
+
+slots.Biosample_sampled_tissue = Slot(uri=PHENOPACKETS.sampled_tissue, name="Biosample_sampled_tissue", curie=PHENOPACKETS.curie('sampled_tissue'),
+                   model_uri=PHENOPACKETS.Biosample_sampled_tissue, domain=Biosample, range=Optional[Union[dict, OntologyClass]])
+
+slots.Biosample_phenotypic_features = Slot(uri=PHENOPACKETS.phenotypic_features, name="Biosample_phenotypic_features", curie=PHENOPACKETS.curie('phenotypic_features'),
+                   model_uri=PHENOPACKETS.Biosample_phenotypic_features, domain=Biosample, range=Optional[Union[Union[dict, PhenotypicFeature], List[Union[dict, PhenotypicFeature]]]])
+
+slots.Biosample_taxonomy = Slot(uri=PHENOPACKETS.taxonomy, name="Biosample_taxonomy", curie=PHENOPACKETS.curie('taxonomy'),
+                   model_uri=PHENOPACKETS.Biosample_taxonomy, domain=Biosample, range=Optional[Union[dict, OntologyClass]])
+
+slots.Biosample_age_of_individual_at_collection = Slot(uri=PHENOPACKETS.age_of_individual_at_collection, name="Biosample_age_of_individual_at_collection", curie=PHENOPACKETS.curie('age_of_individual_at_collection'),
+                   model_uri=PHENOPACKETS.Biosample_age_of_individual_at_collection, domain=Biosample, range=Optional[Union[dict, Age]])
+
+slots.Biosample_age_range_of_individual_at_collection = Slot(uri=PHENOPACKETS.age_range_of_individual_at_collection, name="Biosample_age_range_of_individual_at_collection", curie=PHENOPACKETS.curie('age_range_of_individual_at_collection'),
+                   model_uri=PHENOPACKETS.Biosample_age_range_of_individual_at_collection, domain=Biosample, range=Optional[Union[dict, AgeRange]])
+
+slots.Biosample_histological_diagnosis = Slot(uri=PHENOPACKETS.histological_diagnosis, name="Biosample_histological_diagnosis", curie=PHENOPACKETS.curie('histological_diagnosis'),
+                   model_uri=PHENOPACKETS.Biosample_histological_diagnosis, domain=Biosample, range=Optional[Union[dict, OntologyClass]])
+
+slots.Biosample_tumor_progression = Slot(uri=PHENOPACKETS.tumor_progression, name="Biosample_tumor_progression", curie=PHENOPACKETS.curie('tumor_progression'),
+                   model_uri=PHENOPACKETS.Biosample_tumor_progression, domain=Biosample, range=Optional[Union[dict, OntologyClass]])
+
+slots.Biosample_tumor_grade = Slot(uri=PHENOPACKETS.tumor_grade, name="Biosample_tumor_grade", curie=PHENOPACKETS.curie('tumor_grade'),
+                   model_uri=PHENOPACKETS.Biosample_tumor_grade, domain=Biosample, range=Optional[Union[dict, OntologyClass]])
+
+slots.Biosample_diagnostic_markers = Slot(uri=PHENOPACKETS.diagnostic_markers, name="Biosample_diagnostic_markers", curie=PHENOPACKETS.curie('diagnostic_markers'),
+                   model_uri=PHENOPACKETS.Biosample_diagnostic_markers, domain=Biosample, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.Biosample_procedure = Slot(uri=PHENOPACKETS.procedure, name="Biosample_procedure", curie=PHENOPACKETS.curie('procedure'),
+                   model_uri=PHENOPACKETS.Biosample_procedure, domain=Biosample, range=Optional[str])
+
+slots.Biosample_hts_files = Slot(uri=PHENOPACKETS.hts_files, name="Biosample_hts_files", curie=PHENOPACKETS.curie('hts_files'),
+                   model_uri=PHENOPACKETS.Biosample_hts_files, domain=Biosample, range=Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]])
+
+slots.Biosample_variants = Slot(uri=PHENOPACKETS.variants, name="Biosample_variants", curie=PHENOPACKETS.curie('variants'),
+                   model_uri=PHENOPACKETS.Biosample_variants, domain=Biosample, range=Optional[Union[Union[dict, Variant], List[Union[dict, Variant]]]])
+
+slots.Biosample_is_control_sample = Slot(uri=PHENOPACKETS.is_control_sample, name="Biosample_is_control_sample", curie=PHENOPACKETS.curie('is_control_sample'),
+                   model_uri=PHENOPACKETS.Biosample_is_control_sample, domain=Biosample, range=Optional[Union[bool, Bool]])
+
+slots.Gene_id = Slot(uri=PHENOPACKETS.id, name="Gene_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Gene_id, domain=Gene, range=Optional[str])
+
+slots.Gene_alternate_ids = Slot(uri=PHENOPACKETS.alternate_ids, name="Gene_alternate_ids", curie=PHENOPACKETS.curie('alternate_ids'),
+                   model_uri=PHENOPACKETS.Gene_alternate_ids, domain=Gene, range=Optional[Union[str, List[str]]])
+
+slots.Gene_symbol = Slot(uri=PHENOPACKETS.symbol, name="Gene_symbol", curie=PHENOPACKETS.curie('symbol'),
+                   model_uri=PHENOPACKETS.Gene_symbol, domain=Gene, range=Optional[str])
+
+slots.Disease_term = Slot(uri=PHENOPACKETS.term, name="Disease_term", curie=PHENOPACKETS.curie('term'),
+                   model_uri=PHENOPACKETS.Disease_term, domain=Disease, range=Optional[Union[dict, OntologyClass]])
+
+slots.Disease_age_of_onset = Slot(uri=PHENOPACKETS.age_of_onset, name="Disease_age_of_onset", curie=PHENOPACKETS.curie('age_of_onset'),
+                   model_uri=PHENOPACKETS.Disease_age_of_onset, domain=Disease, range=Optional[Union[dict, Age]])
+
+slots.Disease_age_range_of_onset = Slot(uri=PHENOPACKETS.age_range_of_onset, name="Disease_age_range_of_onset", curie=PHENOPACKETS.curie('age_range_of_onset'),
+                   model_uri=PHENOPACKETS.Disease_age_range_of_onset, domain=Disease, range=Optional[Union[dict, AgeRange]])
+
+slots.Disease_class_of_onset = Slot(uri=PHENOPACKETS.class_of_onset, name="Disease_class_of_onset", curie=PHENOPACKETS.curie('class_of_onset'),
+                   model_uri=PHENOPACKETS.Disease_class_of_onset, domain=Disease, range=Optional[Union[dict, OntologyClass]])
+
+slots.Disease_disease_stage = Slot(uri=PHENOPACKETS.disease_stage, name="Disease_disease_stage", curie=PHENOPACKETS.curie('disease_stage'),
+                   model_uri=PHENOPACKETS.Disease_disease_stage, domain=Disease, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.Disease_tnm_finding = Slot(uri=PHENOPACKETS.tnm_finding, name="Disease_tnm_finding", curie=PHENOPACKETS.curie('tnm_finding'),
+                   model_uri=PHENOPACKETS.Disease_tnm_finding, domain=Disease, range=Optional[Union[Union[dict, OntologyClass], List[Union[dict, OntologyClass]]]])
+
+slots.Phenopacket_id = Slot(uri=PHENOPACKETS.id, name="Phenopacket_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Phenopacket_id, domain=Phenopacket, range=Optional[str])
+
+slots.Phenopacket_subject = Slot(uri=PHENOPACKETS.subject, name="Phenopacket_subject", curie=PHENOPACKETS.curie('subject'),
+                   model_uri=PHENOPACKETS.Phenopacket_subject, domain=Phenopacket, range=Optional[str])
+
+slots.Phenopacket_phenotypic_features = Slot(uri=PHENOPACKETS.phenotypic_features, name="Phenopacket_phenotypic_features", curie=PHENOPACKETS.curie('phenotypic_features'),
+                   model_uri=PHENOPACKETS.Phenopacket_phenotypic_features, domain=Phenopacket, range=Optional[Union[Union[dict, PhenotypicFeature], List[Union[dict, PhenotypicFeature]]]])
+
+slots.Phenopacket_biosamples = Slot(uri=PHENOPACKETS.biosamples, name="Phenopacket_biosamples", curie=PHENOPACKETS.curie('biosamples'),
+                   model_uri=PHENOPACKETS.Phenopacket_biosamples, domain=Phenopacket, range=Optional[Union[Union[dict, Biosample], List[Union[dict, Biosample]]]])
+
+slots.Phenopacket_genes = Slot(uri=PHENOPACKETS.genes, name="Phenopacket_genes", curie=PHENOPACKETS.curie('genes'),
+                   model_uri=PHENOPACKETS.Phenopacket_genes, domain=Phenopacket, range=Optional[Union[Union[dict, Gene], List[Union[dict, Gene]]]])
+
+slots.Phenopacket_variants = Slot(uri=PHENOPACKETS.variants, name="Phenopacket_variants", curie=PHENOPACKETS.curie('variants'),
+                   model_uri=PHENOPACKETS.Phenopacket_variants, domain=Phenopacket, range=Optional[Union[Union[dict, Variant], List[Union[dict, Variant]]]])
+
+slots.Phenopacket_diseases = Slot(uri=PHENOPACKETS.diseases, name="Phenopacket_diseases", curie=PHENOPACKETS.curie('diseases'),
+                   model_uri=PHENOPACKETS.Phenopacket_diseases, domain=Phenopacket, range=Optional[Union[Union[dict, Disease], List[Union[dict, Disease]]]])
+
+slots.Phenopacket_hts_files = Slot(uri=PHENOPACKETS.hts_files, name="Phenopacket_hts_files", curie=PHENOPACKETS.curie('hts_files'),
+                   model_uri=PHENOPACKETS.Phenopacket_hts_files, domain=Phenopacket, range=Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]])
+
+slots.Phenopacket_meta_data = Slot(uri=PHENOPACKETS.meta_data, name="Phenopacket_meta_data", curie=PHENOPACKETS.curie('meta_data'),
+                   model_uri=PHENOPACKETS.Phenopacket_meta_data, domain=Phenopacket, range=Optional[Union[dict, "MetaData"]])
+
+slots.Resource_id = Slot(uri=PHENOPACKETS.id, name="Resource_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Resource_id, domain=Resource, range=Optional[str])
+
+slots.Resource_name = Slot(uri=PHENOPACKETS.name, name="Resource_name", curie=PHENOPACKETS.curie('name'),
+                   model_uri=PHENOPACKETS.Resource_name, domain=Resource, range=Optional[str])
+
+slots.Resource_url = Slot(uri=PHENOPACKETS.url, name="Resource_url", curie=PHENOPACKETS.curie('url'),
+                   model_uri=PHENOPACKETS.Resource_url, domain=Resource, range=Optional[str])
+
+slots.Resource_version = Slot(uri=PHENOPACKETS.version, name="Resource_version", curie=PHENOPACKETS.curie('version'),
+                   model_uri=PHENOPACKETS.Resource_version, domain=Resource, range=Optional[str])
+
+slots.Resource_namespace_prefix = Slot(uri=PHENOPACKETS.namespace_prefix, name="Resource_namespace_prefix", curie=PHENOPACKETS.curie('namespace_prefix'),
+                   model_uri=PHENOPACKETS.Resource_namespace_prefix, domain=Resource, range=Optional[str])
+
+slots.Resource_iri_prefix = Slot(uri=PHENOPACKETS.iri_prefix, name="Resource_iri_prefix", curie=PHENOPACKETS.curie('iri_prefix'),
+                   model_uri=PHENOPACKETS.Resource_iri_prefix, domain=Resource, range=Optional[str])
+
+slots.Update_timestamp = Slot(uri=PHENOPACKETS.timestamp, name="Update_timestamp", curie=PHENOPACKETS.curie('timestamp'),
+                   model_uri=PHENOPACKETS.Update_timestamp, domain=Update, range=Optional[Union[dict, Timestamp]])
+
+slots.Update_updated_by = Slot(uri=PHENOPACKETS.updated_by, name="Update_updated_by", curie=PHENOPACKETS.curie('updated_by'),
+                   model_uri=PHENOPACKETS.Update_updated_by, domain=Update, range=Optional[str])
+
+slots.Update_comment = Slot(uri=PHENOPACKETS.comment, name="Update_comment", curie=PHENOPACKETS.curie('comment'),
+                   model_uri=PHENOPACKETS.Update_comment, domain=Update, range=Optional[str])
+
+slots.MetaData_created = Slot(uri=PHENOPACKETS.created, name="MetaData_created", curie=PHENOPACKETS.curie('created'),
+                   model_uri=PHENOPACKETS.MetaData_created, domain=MetaData, range=Optional[Union[dict, Timestamp]])
+
+slots.MetaData_created_by = Slot(uri=PHENOPACKETS.created_by, name="MetaData_created_by", curie=PHENOPACKETS.curie('created_by'),
+                   model_uri=PHENOPACKETS.MetaData_created_by, domain=MetaData, range=Optional[str])
+
+slots.MetaData_submitted_by = Slot(uri=PHENOPACKETS.submitted_by, name="MetaData_submitted_by", curie=PHENOPACKETS.curie('submitted_by'),
+                   model_uri=PHENOPACKETS.MetaData_submitted_by, domain=MetaData, range=Optional[str])
+
+slots.MetaData_resources = Slot(uri=PHENOPACKETS.resources, name="MetaData_resources", curie=PHENOPACKETS.curie('resources'),
+                   model_uri=PHENOPACKETS.MetaData_resources, domain=MetaData, range=Optional[Union[Union[dict, Resource], List[Union[dict, Resource]]]])
+
+slots.MetaData_updates = Slot(uri=PHENOPACKETS.updates, name="MetaData_updates", curie=PHENOPACKETS.curie('updates'),
+                   model_uri=PHENOPACKETS.MetaData_updates, domain=MetaData, range=Optional[Union[Union[dict, Update], List[Union[dict, Update]]]])
+
+slots.MetaData_phenopacket_schema_version = Slot(uri=PHENOPACKETS.phenopacket_schema_version, name="MetaData_phenopacket_schema_version", curie=PHENOPACKETS.curie('phenopacket_schema_version'),
+                   model_uri=PHENOPACKETS.MetaData_phenopacket_schema_version, domain=MetaData, range=Optional[str])
+
+slots.MetaData_external_references = Slot(uri=PHENOPACKETS.external_references, name="MetaData_external_references", curie=PHENOPACKETS.curie('external_references'),
+                   model_uri=PHENOPACKETS.MetaData_external_references, domain=MetaData, range=Optional[Union[Union[dict, ExternalReference], List[Union[dict, ExternalReference]]]])
+
+slots.Family_id = Slot(uri=PHENOPACKETS.id, name="Family_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Family_id, domain=Family, range=Optional[str])
+
+slots.Family_proband = Slot(uri=PHENOPACKETS.proband, name="Family_proband", curie=PHENOPACKETS.curie('proband'),
+                   model_uri=PHENOPACKETS.Family_proband, domain=Family, range=Optional[Union[dict, Phenopacket]])
+
+slots.Family_relatives = Slot(uri=PHENOPACKETS.relatives, name="Family_relatives", curie=PHENOPACKETS.curie('relatives'),
+                   model_uri=PHENOPACKETS.Family_relatives, domain=Family, range=Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]])
+
+slots.Family_pedigree = Slot(uri=PHENOPACKETS.pedigree, name="Family_pedigree", curie=PHENOPACKETS.curie('pedigree'),
+                   model_uri=PHENOPACKETS.Family_pedigree, domain=Family, range=Optional[str])
+
+slots.Family_hts_files = Slot(uri=PHENOPACKETS.hts_files, name="Family_hts_files", curie=PHENOPACKETS.curie('hts_files'),
+                   model_uri=PHENOPACKETS.Family_hts_files, domain=Family, range=Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]])
+
+slots.Family_meta_data = Slot(uri=PHENOPACKETS.meta_data, name="Family_meta_data", curie=PHENOPACKETS.curie('meta_data'),
+                   model_uri=PHENOPACKETS.Family_meta_data, domain=Family, range=Optional[Union[dict, MetaData]])
+
+slots.Cohort_id = Slot(uri=PHENOPACKETS.id, name="Cohort_id", curie=PHENOPACKETS.curie('id'),
+                   model_uri=PHENOPACKETS.Cohort_id, domain=Cohort, range=Optional[str])
+
+slots.Cohort_description = Slot(uri=PHENOPACKETS.description, name="Cohort_description", curie=PHENOPACKETS.curie('description'),
+                   model_uri=PHENOPACKETS.Cohort_description, domain=Cohort, range=Optional[str])
+
+slots.Cohort_members = Slot(uri=PHENOPACKETS.members, name="Cohort_members", curie=PHENOPACKETS.curie('members'),
+                   model_uri=PHENOPACKETS.Cohort_members, domain=Cohort, range=Optional[Union[Union[dict, Phenopacket], List[Union[dict, Phenopacket]]]])
+
+slots.Cohort_hts_files = Slot(uri=PHENOPACKETS.hts_files, name="Cohort_hts_files", curie=PHENOPACKETS.curie('hts_files'),
+                   model_uri=PHENOPACKETS.Cohort_hts_files, domain=Cohort, range=Optional[Union[Union[dict, HtsFile], List[Union[dict, HtsFile]]]])
+
+slots.Cohort_meta_data = Slot(uri=PHENOPACKETS.meta_data, name="Cohort_meta_data", curie=PHENOPACKETS.curie('meta_data'),
+                   model_uri=PHENOPACKETS.Cohort_meta_data, domain=Cohort, range=Optional[Union[dict, MetaData]])
\ No newline at end of file
@@ -0,0 +1,1112 @@
+# Auto generated from vrs.schema.yaml by pythongen.py version: 0.0.1
+# Generation date: 2026-10-15T22:39:11
+# Schema: GA4GH_VRS_Definitions
+#
+# id: http://json-schema.org/draft-07/schema
+# description:
+# license: https://creativecommons.org/publicdomain/zero/1.0/
+
+import dataclasses
+import re
+from dataclasses import dataclass
+from datetime import (
+    date,
+    datetime,
+    time
+)
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Union
+)
+
+from jsonasobj2 import (
+    JsonObj,
+    as_dict
+)
+from linkml_runtime.linkml_model.meta import (
+    EnumDefinition,
+    PermissibleValue,
+    PvFormulaOptions
+)
+from linkml_runtime.utils.curienamespace import CurieNamespace
+from linkml_runtime.utils.dataclass_extensions_376 import dataclasses_init_fn_with_kwargs
+from linkml_runtime.utils.enumerations import EnumDefinitionImpl
+from linkml_runtime.utils.formatutils import (
+    camelcase,
+    sfx,
+    underscore
+)
+from linkml_runtime.utils.metamodelcore import (
+    bnode,
+    empty_dict,
+    empty_list
+)
+from linkml_runtime.utils.slot import Slot
+from linkml_runtime.utils.yamlutils import (
+    YAMLRoot,
+    extended_float,
+    extended_int,
+    extended_str
+)
+from rdflib import (
+    Namespace,
+    URIRef
+)
+
+from linkml_runtime.linkml_model.types import Boolean, Float, Integer, String
+from linkml_runtime.utils.metamodelcore import Bool
+
+metamodel_version = "1.7.0"
+version = None
+
+# Overwrite dataclasses _init_fn to add **kwargs in __init__
+dataclasses._init_fn = dataclasses_init_fn_with_kwargs
+
+# Namespaces
+GA4GH_VRS_DEFINITIONS = CurieNamespace('GA4GH_VRS_Definitions', 'http://json-schema.org/draft-07/schema')
+LINKML = CurieNamespace('linkml', 'https://w3id.org/linkml/')
+DEFAULT_ = GA4GH_VRS_DEFINITIONS
+
+
+# Types
+
+# Class references
+
+
+
+class Variation(YAMLRoot):
+    """
+    A representation of the state of one or more biomolecules.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Variation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Variation"
+    class_name: ClassVar[str] = "Variation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Variation
+
+
+class MolecularVariation(YAMLRoot):
+    """
+    A variation on a contiguous molecule.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["MolecularVariation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:MolecularVariation"
+    class_name: ClassVar[str] = "MolecularVariation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.MolecularVariation
+
+
+class UtilityVariation(YAMLRoot):
+    """
+    A collection of :ref:`Variation` subclasses that cannot be constrained to a specific class of biological
+    variation, but are necessary for some applications of VRS.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["UtilityVariation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:UtilityVariation"
+    class_name: ClassVar[str] = "UtilityVariation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.UtilityVariation
+
+
+class SystemicVariation(YAMLRoot):
+    """
+    A Variation of multiple molecules in the context of a system, e.g. a genome, sample, or homologous chromosomes.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SystemicVariation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SystemicVariation"
+    class_name: ClassVar[str] = "SystemicVariation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SystemicVariation
+
+
+@dataclass(repr=False)
+class Allele(YAMLRoot):
+    """
+    The sequence state at a Location.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Allele"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Allele"
+    class_name: ClassVar[str] = "Allele"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Allele
+
+    type: Union[str, "TypeOptions"] = None
+    location: Union[dict, "SequenceLocation"] = None
+    state: str = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.location):
+            self.MissingRequiredField("location")
+        if not isinstance(self.location, SequenceLocation):
+            self.location = SequenceLocation(**as_dict(self.location))
+
+        if self._is_empty(self.state):
+            self.MissingRequiredField("state")
+        if not isinstance(self.state, str):
+            self.state = str(self.state)
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Haplotype(YAMLRoot):
+    """
+    A set of non-overlapping Alleles that co-occur on the same molecule.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Haplotype"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Haplotype"
+    class_name: ClassVar[str] = "Haplotype"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Haplotype
+
+    type: Union[str, "TypeOptions"] = None
+    members: Union[str, List[str]] = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.members):
+            self.MissingRequiredField("members")
+        if not isinstance(self.members, list):
+            self.members = [self.members] if self.members is not None else []
+        self.members = [v if isinstance(v, str) else str(v) for v in self.members]
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Text(YAMLRoot):
+    """
+    A free-text definition of variation.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Text"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Text"
+    class_name: ClassVar[str] = "Text"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Text
+
+    type: Union[str, "TypeOptions"] = None
+    definition: str = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.definition):
+            self.MissingRequiredField("definition")
+        if not isinstance(self.definition, str):
+            self.definition = str(self.definition)
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class VariationSet(YAMLRoot):
+    """
+    An unconstrained set of Variation members.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["VariationSet"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:VariationSet"
+    class_name: ClassVar[str] = "VariationSet"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.VariationSet
+
+    type: Union[str, "TypeOptions"] = None
+    members: Union[str, List[str]] = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.members):
+            self.MissingRequiredField("members")
+        if not isinstance(self.members, list):
+            self.members = [self.members] if self.members is not None else []
+        self.members = [v if isinstance(v, str) else str(v) for v in self.members]
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class CopyNumber(YAMLRoot):
+    """
+    The count of discrete copies of a Feature, Molecular Variation, or other molecule within a genome.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["CopyNumber"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:CopyNumber"
+    class_name: ClassVar[str] = "CopyNumber"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.CopyNumber
+
+    type: Union[str, "TypeOptions"] = None
+    subject: str = None
+    copies: str = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.subject):
+            self.MissingRequiredField("subject")
+        if not isinstance(self.subject, str):
+            self.subject = str(self.subject)
+
+        if self._is_empty(self.copies):
+            self.MissingRequiredField("copies")
+        if not isinstance(self.copies, str):
+            self.copies = str(self.copies)
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+class Location(YAMLRoot):
+    """
+    A contiguous segment of a biological sequence.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Location"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Location"
+    class_name: ClassVar[str] = "Location"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Location
+
+
+@dataclass(repr=False)
+class ChromosomeLocation(YAMLRoot):
+    """
+    A Location on a chromosome defined by a species and chromosome name.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["ChromosomeLocation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:ChromosomeLocation"
+    class_name: ClassVar[str] = "ChromosomeLocation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.ChromosomeLocation
+
+    type: Union[str, "TypeOptions"] = None
+    species_id: Union[dict, "CURIE"] = None
+    chr: str = None
+    interval: Union[dict, "CytobandInterval"] = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.species_id):
+            self.MissingRequiredField("species_id")
+        if not isinstance(self.species_id, CURIE):
+            self.species_id = CURIE()
+
+        if self._is_empty(self.chr):
+            self.MissingRequiredField("chr")
+        if not isinstance(self.chr, str):
+            self.chr = str(self.chr)
+
+        if self._is_empty(self.interval):
+            self.MissingRequiredField("interval")
+        if not isinstance(self.interval, CytobandInterval):
+            self.interval = CytobandInterval(**as_dict(self.interval))
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class SequenceLocation(YAMLRoot):
+    """
+    A Location defined by an interval on a referenced Sequence.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SequenceLocation"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SequenceLocation"
+    class_name: ClassVar[str] = "SequenceLocation"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SequenceLocation
+
+    type: Union[str, "TypeOptions"] = None
+    sequence_id: Union[dict, "CURIE"] = None
+    interval: str = None
+    _id: Optional[Union[dict, "CURIE"]] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.sequence_id):
+            self.MissingRequiredField("sequence_id")
+        if not isinstance(self.sequence_id, CURIE):
+            self.sequence_id = CURIE()
+
+        if self._is_empty(self.interval):
+            self.MissingRequiredField("interval")
+        if not isinstance(self.interval, str):
+            self.interval = str(self.interval)
+
+        if self._id is not None and not isinstance(self._id, CURIE):
+            self._id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class SequenceInterval(YAMLRoot):
+    """
+    A SequenceInterval represents a span of sequence. Positions are always represented by contiguous spans using
+    interbase coordinates.
+    SequenceInterval is intended to be compatible with that in Sequence Ontology
+    ([SO:0000001](http://www.sequenceontology.org/browser/current_svn/term/SO:0000001)), with the exception that the
+    GA4GH VRS SequenceInterval may be zero-width. The SO definition is for an "extent greater than zero".
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SequenceInterval"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SequenceInterval"
+    class_name: ClassVar[str] = "SequenceInterval"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SequenceInterval
+
+    type: Union[str, "TypeOptions"] = None
+    start: int = None
+    end: int = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.start):
+            self.MissingRequiredField("start")
+        if not isinstance(self.start, int):
+            self.start = int(self.start)
+
+        if self._is_empty(self.end):
+            self.MissingRequiredField("end")
+        if not isinstance(self.end, int):
+            self.end = int(self.end)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class CytobandInterval(YAMLRoot):
+    """
+    A contiguous region specified by chromosomal bands features.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["CytobandInterval"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:CytobandInterval"
+    class_name: ClassVar[str] = "CytobandInterval"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.CytobandInterval
+
+    type: Union[str, "TypeOptions"] = None
+    start: Union[dict, "HumanCytoband"] = None
+    end: Union[dict, "HumanCytoband"] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.start):
+            self.MissingRequiredField("start")
+        if not isinstance(self.start, HumanCytoband):
+            self.start = HumanCytoband()
+
+        if self._is_empty(self.end):
+            self.MissingRequiredField("end")
+        if not isinstance(self.end, HumanCytoband):
+            self.end = HumanCytoband()
+
+        super().__post_init__(**kwargs)
+
+
+class SequenceExpression(YAMLRoot):
+    """
+    One of a set of sequence representation syntaxes.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SequenceExpression"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SequenceExpression"
+    class_name: ClassVar[str] = "SequenceExpression"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SequenceExpression
+
+
+@dataclass(repr=False)
+class LiteralSequenceExpression(YAMLRoot):
+    """
+    An explicit expression of a Sequence.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["LiteralSequenceExpression"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:LiteralSequenceExpression"
+    class_name: ClassVar[str] = "LiteralSequenceExpression"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.LiteralSequenceExpression
+
+    type: Union[str, "TypeOptions"] = None
+    sequence: Union[dict, "Sequence"] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.sequence):
+            self.MissingRequiredField("sequence")
+        if not isinstance(self.sequence, Sequence):
+            self.sequence = Sequence()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class DerivedSequenceExpression(YAMLRoot):
+    """
+    An approximate expression of a sequence that is derived from a referenced sequence location. Use of
+    DerivedSequenceExpression indicates that the derived sequence is approximately equivalent to the reference
+    indicated, and is typically used for describing large regions in contexts where the precision of a literal
+    sequence is unnecessary.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["DerivedSequenceExpression"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:DerivedSequenceExpression"
+    class_name: ClassVar[str] = "DerivedSequenceExpression"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.DerivedSequenceExpression
+
+    type: Union[str, "TypeOptions"] = None
+    location: Union[dict, SequenceLocation] = None
+    reverse_complement: Union[bool, Bool] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.location):
+            self.MissingRequiredField("location")
+        if not isinstance(self.location, SequenceLocation):
+            self.location = SequenceLocation(**as_dict(self.location))
+
+        if self._is_empty(self.reverse_complement):
+            self.MissingRequiredField("reverse_complement")
+        if not isinstance(self.reverse_complement, Bool):
+            self.reverse_complement = Bool(self.reverse_complement)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class RepeatedSequenceExpression(YAMLRoot):
+    """
+    An expression of a sequence comprised of a tandem repeating subsequence.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["RepeatedSequenceExpression"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:RepeatedSequenceExpression"
+    class_name: ClassVar[str] = "RepeatedSequenceExpression"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.RepeatedSequenceExpression
+
+    type: Union[str, "TypeOptions"] = None
+    seq_expr: str = None
+    count: str = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.seq_expr):
+            self.MissingRequiredField("seq_expr")
+        if not isinstance(self.seq_expr, str):
+            self.seq_expr = str(self.seq_expr)
+
+        if self._is_empty(self.count):
+            self.MissingRequiredField("count")
+        if not isinstance(self.count, str):
+            self.count = str(self.count)
+
+        super().__post_init__(**kwargs)
+
+
+class Feature(YAMLRoot):
+    """
+    A named entity that can be mapped to a Location. Genes, protein domains, exons, and chromosomes are some examples
+    of common biological entities that may be Features.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Feature"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Feature"
+    class_name: ClassVar[str] = "Feature"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Feature
+
+
+@dataclass(repr=False)
+class Gene(YAMLRoot):
+    """
+    A gene is an authoritative representation of one or more heritable :ref:`Locations <Location>` that includes all
+    sequence elements necessary to perform a biological function. A gene may include regulatory, transcribed, and/or
+    other functional Locations.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Gene"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Gene"
+    class_name: ClassVar[str] = "Gene"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Gene
+
+    type: Union[str, "TypeOptions"] = None
+    gene_id: Union[dict, "CURIE"] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.gene_id):
+            self.MissingRequiredField("gene_id")
+        if not isinstance(self.gene_id, CURIE):
+            self.gene_id = CURIE()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class Number(YAMLRoot):
+    """
+    A simple number value as a VRS class.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Number"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Number"
+    class_name: ClassVar[str] = "Number"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Number
+
+    type: Union[str, "TypeOptions"] = None
+    value: float = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.value):
+            self.MissingRequiredField("value")
+        if not isinstance(self.value, float):
+            self.value = float(self.value)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class IndefiniteRange(YAMLRoot):
+    """
+    An indefinite range represented as a number and associated comparator. The bound operator is interpreted as
+    follows: '>=' are all values greater than and including the value, '<=' are all numbers less than and including
+    the value.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["IndefiniteRange"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:IndefiniteRange"
+    class_name: ClassVar[str] = "IndefiniteRange"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.IndefiniteRange
+
+    type: Union[str, "TypeOptions"] = None
+    value: float = None
+    comparator: Union[str, "ComparatorOptions"] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.value):
+            self.MissingRequiredField("value")
+        if not isinstance(self.value, float):
+            self.value = float(self.value)
+
+        if self._is_empty(self.comparator):
+            self.MissingRequiredField("comparator")
+        if not isinstance(self.comparator, ComparatorOptions):
+            self.comparator = ComparatorOptions(self.comparator)
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class DefiniteRange(YAMLRoot):
+    """
+    A bounded, inclusive range of numbers.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["DefiniteRange"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:DefiniteRange"
+    class_name: ClassVar[str] = "DefiniteRange"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.DefiniteRange
+
+    type: Union[str, "TypeOptions"] = None
+    min: float = None
+    max: float = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.min):
+            self.MissingRequiredField("min")
+        if not isinstance(self.min, float):
+            self.min = float(self.min)
+
+        if self._is_empty(self.max):
+            self.MissingRequiredField("max")
+        if not isinstance(self.max, float):
+            self.max = float(self.max)
+
+        super().__post_init__(**kwargs)
+
+
+class Sequence(YAMLRoot):
+    """
+    A character string of residues that represents a biological sequence using the conventional sequence order
+    (5’-to-3’ for nucleic acid sequences, and amino-to-carboxyl for amino acid sequences). IUPAC ambiguity codes are
+    permitted in Sequences.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["Sequence"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:Sequence"
+    class_name: ClassVar[str] = "Sequence"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.Sequence
+
+
+class CURIE(YAMLRoot):
+    """
+    A string that refers to an object uniquely.  The lifetime and scope of an id is defined by the sender.
+    VRS does not impose any contraints on strings used as ids in messages. However, to maximize sharability of data,
+    VRS RECOMMENDS that implementations use [W3C Compact URI (CURIE)](https://www.w3.org/TR/curie/) syntax.
+    String CURIEs are represented as `prefix`:`reference` (W3C terminology), but often referred to as
+    `namespace`:`accession` or `namespace`:`local id` colloquially.
+    VRS also RECOMMENDS that `prefix` be defined in identifiers.org.
+    The `reference` component is an unconstrained string.
+    A CURIE is a URI. URIs may *locate* objects (i.e., specify where to retrieve them) or *name* objects conceptually.
+    VRS uses CURIEs primarily as a naming mechanism.
+    Implementations MAY provide CURIE resolution mechanisms for prefixes to make these objects locatable.
+    Using internal ids in public messages is strongly discouraged.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["CURIE"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:CURIE"
+    class_name: ClassVar[str] = "CURIE"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.CURIE
+
+
+class HumanCytoband(YAMLRoot):
+    """
+    A interval on a stained metaphase chromosome specified by cytobands. CytobandIntervals include the regions
+    described by the start and end cytobands.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["HumanCytoband"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:HumanCytoband"
+    class_name: ClassVar[str] = "HumanCytoband"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.HumanCytoband
+
+
+@dataclass(repr=False)
+class SequenceState(YAMLRoot):
+    """
+    DEPRECATED: An assertion of the state of a sequence, typically at a Sequence Location within an Allele.
+    This class is deprecated. Use LiteralSequenceExpression instead.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SequenceState"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SequenceState"
+    class_name: ClassVar[str] = "SequenceState"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SequenceState
+
+    type: Union[str, "TypeOptions"] = None
+    sequence: Union[dict, Sequence] = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.sequence):
+            self.MissingRequiredField("sequence")
+        if not isinstance(self.sequence, Sequence):
+            self.sequence = Sequence()
+
+        super().__post_init__(**kwargs)
+
+
+@dataclass(repr=False)
+class SimpleInterval(YAMLRoot):
+    """
+    DEPRECATED: A SimpleInterval represents a span of sequence. Positions are always represented by contiguous spans
+    using interbase coordinates.
+    This class is deprecated. Use SequenceInterval instead.
+    """
+    _inherited_slots: ClassVar[List[str]] = []
+
+    class_class_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS["SimpleInterval"]
+    class_class_curie: ClassVar[str] = "GA4GH_VRS_Definitions:SimpleInterval"
+    class_name: ClassVar[str] = "SimpleInterval"
+    class_model_uri: ClassVar[URIRef] = GA4GH_VRS_DEFINITIONS.SimpleInterval
+
+    type: Union[str, "TypeOptions"] = None
+    start: int = None
+    end: int = None
+
+    def __post_init__(self, *_: List[str], **kwargs: Dict[str, Any]):
+        if self._is_empty(self.type):
+            self.MissingRequiredField("type")
+        if not isinstance(self.type, TypeOptions):
+            self.type = TypeOptions(self.type)
+
+        if self._is_empty(self.start):
+            self.MissingRequiredField("start")
+        if not isinstance(self.start, int):
+            self.start = int(self.start)
+
+        if self._is_empty(self.end):
+            self.MissingRequiredField("end")
+        if not isinstance(self.end, int):
+            self.end = int(self.end)
+
+        super().__post_init__(**kwargs)
+
+
+# Enumerations
+class TypeOptions(EnumDefinitionImpl):
+
+    SimpleInterval = PermissibleValue(text="SimpleInterval")
+
+    _defn = EnumDefinition(
+        name="TypeOptions",
+    )
+
+class ComparatorOptions(EnumDefinitionImpl):
+
+    _defn = EnumDefinition(
+        name="ComparatorOptions",
+    )
+
+    @classmethod
+    def _addvals(cls):
+        setattr(cls, "<=",
+            PermissibleValue(text="<="))
+        setattr(cls, ">=",
+            PermissibleValue(text=">="))
+
+# Slots
+class slots:
+    pass
+
+slots._id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="_id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS._id, domain=None, range=Optional[Union[dict, CURIE]])
+
+slots.type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.type, domain=None, range=Union[str, "TypeOptions"])
+
+slots.location = Slot(uri=GA4GH_VRS_DEFINITIONS.location, name="location", curie=GA4GH_VRS_DEFINITIONS.curie('location'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.location, domain=None, range=Union[dict, SequenceLocation])
+
+slots.state = Slot(uri=GA4GH_VRS_DEFINITIONS.state, name="state", curie=GA4GH_VRS_DEFINITIONS.curie('state'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.state, domain=None, range=str)
+
+slots.members = Slot(uri=GA4GH_VRS_DEFINITIONS.members, name="members", curie=GA4GH_VRS_DEFINITIONS.curie('members'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.members, domain=None, range=Union[str, List[str]])
+
+slots.definition = Slot(uri=GA4GH_VRS_DEFINITIONS.definition, name="definition", curie=GA4GH_VRS_DEFINITIONS.curie('definition'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.definition, domain=None, range=str)
+
+slots.subject = Slot(uri=GA4GH_VRS_DEFINITIONS.subject, name="subject", curie=GA4GH_VRS_DEFINITIONS.curie('subject'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.subject, domain=None, range=str)
+
+slots.copies = Slot(uri=GA4GH_VRS_DEFINITIONS.copies, name="copies", curie=GA4GH_VRS_DEFINITIONS.curie('copies'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.copies, domain=None, range=str)
+
+slots.species_id = Slot(uri=GA4GH_VRS_DEFINITIONS.species_id, name="species_id", curie=GA4GH_VRS_DEFINITIONS.curie('species_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.species_id, domain=None, range=Union[dict, CURIE])
+
+slots.chr = Slot(uri=GA4GH_VRS_DEFINITIONS.chr, name="chr", curie=GA4GH_VRS_DEFINITIONS.curie('chr'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.chr, domain=None, range=str)
+
+slots.interval = Slot(uri=GA4GH_VRS_DEFINITIONS.interval, name="interval", curie=GA4GH_VRS_DEFINITIONS.curie('interval'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.interval, domain=None, range=str)
+
+slots.sequence_id = Slot(uri=GA4GH_VRS_DEFINITIONS.sequence_id, name="sequence_id", curie=GA4GH_VRS_DEFINITIONS.curie('sequence_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.sequence_id, domain=None, range=Union[dict, CURIE])
+
+slots.start = Slot(uri=GA4GH_VRS_DEFINITIONS.start, name="start", curie=GA4GH_VRS_DEFINITIONS.curie('start'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.start, domain=None, range=int)
+
+slots.end = Slot(uri=GA4GH_VRS_DEFINITIONS.end, name="end", curie=GA4GH_VRS_DEFINITIONS.curie('end'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.end, domain=None, range=int)
+
+slots.sequence = Slot(uri=GA4GH_VRS_DEFINITIONS.sequence, name="sequence", curie=GA4GH_VRS_DEFINITIONS.curie('sequence'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.sequence, domain=None, range=Union[dict, Sequence])
+
+slots.reverse_complement = Slot(uri=GA4GH_VRS_DEFINITIONS.reverse_complement, name="reverse_complement", curie=GA4GH_VRS_DEFINITIONS.curie('reverse_complement'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.reverse_complement, domain=None, range=Union[bool, Bool])
+
+slots.seq_expr = Slot(uri=GA4GH_VRS_DEFINITIONS.seq_expr, name="seq_expr", curie=GA4GH_VRS_DEFINITIONS.curie('seq_expr'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.seq_expr, domain=None, range=str)
+
+slots.count = Slot(uri=GA4GH_VRS_DEFINITIONS.count, name="count", curie=GA4GH_VRS_DEFINITIONS.curie('count'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.count, domain=None, range=str)
+
+slots.gene_id = Slot(uri=GA4GH_VRS_DEFINITIONS.gene_id, name="gene_id", curie=GA4GH_VRS_DEFINITIONS.curie('gene_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.gene_id, domain=None, range=Union[dict, CURIE])
+
+slots.value = Slot(uri=GA4GH_VRS_DEFINITIONS.value, name="value", curie=GA4GH_VRS_DEFINITIONS.curie('value'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.value, domain=None, range=float)
+
+slots.comparator = Slot(uri=GA4GH_VRS_DEFINITIONS.comparator, name="comparator", curie=GA4GH_VRS_DEFINITIONS.curie('comparator'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.comparator, domain=None, range=Union[str, "ComparatorOptions"])
+
+slots.min = Slot(uri=GA4GH_VRS_DEFINITIONS.min, name="min", curie=GA4GH_VRS_DEFINITIONS.curie('min'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.min, domain=None, range=float)
+
+slots.max = Slot(uri=GA4GH_VRS_DEFINITIONS.max, name="max", curie=GA4GH_VRS_DEFINITIONS.curie('max'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.max, domain=None, range=float)
+
+slots.Allele__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="Allele__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Allele__id, domain=Allele, range=Optional[Union[dict, "CURIE"]])
+
+slots.Allele_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="Allele_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Allele_type, domain=Allele, range=Union[str, "TypeOptions"])
+
+slots.Allele_location = Slot(uri=GA4GH_VRS_DEFINITIONS.location, name="Allele_location", curie=GA4GH_VRS_DEFINITIONS.curie('location'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Allele_location, domain=Allele, range=Union[dict, "SequenceLocation"])
+
+slots.Allele_state = Slot(uri=GA4GH_VRS_DEFINITIONS.state, name="Allele_state", curie=GA4GH_VRS_DEFINITIONS.curie('state'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Allele_state, domain=Allele, range=str)
+
+slots.Haplotype__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="Haplotype__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Haplotype__id, domain=Haplotype, range=Optional[Union[dict, "CURIE"]])
+
+slots.Haplotype_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="Haplotype_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Haplotype_type, domain=Haplotype, range=Union[str, "TypeOptions"])
+
+slots.Haplotype_members = Slot(uri=GA4GH_VRS_DEFINITIONS.members, name="Haplotype_members", curie=GA4GH_VRS_DEFINITIONS.curie('members'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Haplotype_members, domain=Haplotype, range=Union[str, List[str]])
+
+slots.Text__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="Text__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Text__id, domain=Text, range=Optional[Union[dict, "CURIE"]])
+
+slots.Text_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="Text_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Text_type, domain=Text, range=Union[str, "TypeOptions"])
+
+slots.Text_definition = Slot(uri=GA4GH_VRS_DEFINITIONS.definition, name="Text_definition", curie=GA4GH_VRS_DEFINITIONS.curie('definition'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Text_definition, domain=Text, range=str)
+
+slots.VariationSet__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="VariationSet__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.VariationSet__id, domain=VariationSet, range=Optional[Union[dict, "CURIE"]])
+
+slots.VariationSet_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="VariationSet_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.VariationSet_type, domain=VariationSet, range=Union[str, "TypeOptions"])
+
+slots.VariationSet_members = Slot(uri=GA4GH_VRS_DEFINITIONS.members, name="VariationSet_members", curie=GA4GH_VRS_DEFINITIONS.curie('members'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.VariationSet_members, domain=VariationSet, range=Union[str, List[str]])
+
+slots.CopyNumber__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="CopyNumber__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CopyNumber__id, domain=CopyNumber, range=Optional[Union[dict, "CURIE"]])
+
+slots.CopyNumber_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="CopyNumber_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CopyNumber_type, domain=CopyNumber, range=Union[str, "TypeOptions"])
+
+slots.CopyNumber_subject = Slot(uri=GA4GH_VRS_DEFINITIONS.subject, name="CopyNumber_subject", curie=GA4GH_VRS_DEFINITIONS.curie('subject'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CopyNumber_subject, domain=CopyNumber, range=str)
+
+slots.CopyNumber_copies = Slot(uri=GA4GH_VRS_DEFINITIONS.copies, name="CopyNumber_copies", curie=GA4GH_VRS_DEFINITIONS.curie('copies'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CopyNumber_copies, domain=CopyNumber, range=str)
+
+slots.ChromosomeLocation_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="ChromosomeLocation_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.ChromosomeLocation_type, domain=ChromosomeLocation, range=Union[str, "TypeOptions"])
+
+slots.ChromosomeLocation__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="ChromosomeLocation__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.ChromosomeLocation__id, domain=ChromosomeLocation, range=Optional[Union[dict, "CURIE"]])
+
+slots.ChromosomeLocation_species_id = Slot(uri=GA4GH_VRS_DEFINITIONS.species_id, name="ChromosomeLocation_species_id", curie=GA4GH_VRS_DEFINITIONS.curie('species_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.ChromosomeLocation_species_id, domain=ChromosomeLocation, range=Union[dict, "CURIE"])
+
+slots.ChromosomeLocation_chr = Slot(uri=GA4GH_VRS_DEFINITIONS.chr, name="ChromosomeLocation_chr", curie=GA4GH_VRS_DEFINITIONS.curie('chr'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.ChromosomeLocation_chr, domain=ChromosomeLocation, range=str)
+
+slots.ChromosomeLocation_interval = Slot(uri=GA4GH_VRS_DEFINITIONS.interval, name="ChromosomeLocation_interval", curie=GA4GH_VRS_DEFINITIONS.curie('interval'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.ChromosomeLocation_interval, domain=ChromosomeLocation, range=Union[dict, "CytobandInterval"])
+
+slots.SequenceLocation__id = Slot(uri=GA4GH_VRS_DEFINITIONS._id, name="SequenceLocation__id", curie=GA4GH_VRS_DEFINITIONS.curie('_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceLocation__id, domain=SequenceLocation, range=Optional[Union[dict, "CURIE"]])
+
+slots.SequenceLocation_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="SequenceLocation_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceLocation_type, domain=SequenceLocation, range=Union[str, "TypeOptions"])
+
+slots.SequenceLocation_sequence_id = Slot(uri=GA4GH_VRS_DEFINITIONS.sequence_id, name="SequenceLocation_sequence_id", curie=GA4GH_VRS_DEFINITIONS.curie('sequence_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceLocation_sequence_id, domain=SequenceLocation, range=Union[dict, "CURIE"])
+
+slots.SequenceLocation_interval = Slot(uri=GA4GH_VRS_DEFINITIONS.interval, name="SequenceLocation_interval", curie=GA4GH_VRS_DEFINITIONS.curie('interval'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceLocation_interval, domain=SequenceLocation, range=str)
+
+slots.SequenceInterval_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="SequenceInterval_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceInterval_type, domain=SequenceInterval, range=Union[str, "TypeOptions"])
+
+slots.SequenceInterval_start = Slot(uri=GA4GH_VRS_DEFINITIONS.start, name="SequenceInterval_start", curie=GA4GH_VRS_DEFINITIONS.curie('start'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceInterval_start, domain=SequenceInterval, range=int)
+
+slots.SequenceInterval_end = Slot(uri=GA4GH_VRS_DEFINITIONS.end, name="SequenceInterval_end", curie=GA4GH_VRS_DEFINITIONS.curie('end'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceInterval_end, domain=SequenceInterval, range=int)
+
+slots.CytobandInterval_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="CytobandInterval_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CytobandInterval_type, domain=CytobandInterval, range=Union[str, "TypeOptions"])
+
+slots.CytobandInterval_start = Slot(uri=GA4GH_VRS_DEFINITIONS.start, name="CytobandInterval_start", curie=GA4GH_VRS_DEFINITIONS.curie('start'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CytobandInterval_start, domain=CytobandInterval, range=Union[dict, "HumanCytoband"])
+
+slots.CytobandInterval_end = Slot(uri=GA4GH_VRS_DEFINITIONS.end, name="CytobandInterval_end", curie=GA4GH_VRS_DEFINITIONS.curie('end'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.CytobandInterval_end, domain=CytobandInterval, range=Union[dict, "HumanCytoband"])
+
+slots.LiteralSequenceExpression_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="LiteralSequenceExpression_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.LiteralSequenceExpression_type, domain=LiteralSequenceExpression, range=Union[str, "TypeOptions"])
+
+slots.LiteralSequenceExpression_sequence = Slot(uri=GA4GH_VRS_DEFINITIONS.sequence, name="LiteralSequenceExpression_sequence", curie=GA4GH_VRS_DEFINITIONS.curie('sequence'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.LiteralSequenceExpression_sequence, domain=LiteralSequenceExpression, range=Union[dict, "Sequence"])
+
+slots.DerivedSequenceExpression_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="DerivedSequenceExpression_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DerivedSequenceExpression_type, domain=DerivedSequenceExpression, range=Union[str, "TypeOptions"])
+
+slots.DerivedSequenceExpression_location = Slot(uri=GA4GH_VRS_DEFINITIONS.location, name="DerivedSequenceExpression_location", curie=GA4GH_VRS_DEFINITIONS.curie('location'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DerivedSequenceExpression_location, domain=DerivedSequenceExpression, range=Union[dict, SequenceLocation])
+
+slots.DerivedSequenceExpression_reverse_complement = Slot(uri=GA4GH_VRS_DEFINITIONS.reverse_complement, name="DerivedSequenceExpression_reverse_complement", curie=GA4GH_VRS_DEFINITIONS.curie('reverse_complement'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DerivedSequenceExpression_reverse_complement, domain=DerivedSequenceExpression, range=Union[bool, Bool])
+
+slots.RepeatedSequenceExpression_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="RepeatedSequenceExpression_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.RepeatedSequenceExpression_type, domain=RepeatedSequenceExpression, range=Union[str, "TypeOptions"])
+
+slots.RepeatedSequenceExpression_seq_expr = Slot(uri=GA4GH_VRS_DEFINITIONS.seq_expr, name="RepeatedSequenceExpression_seq_expr", curie=GA4GH_VRS_DEFINITIONS.curie('seq_expr'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.RepeatedSequenceExpression_seq_expr, domain=RepeatedSequenceExpression, range=str)
+
+slots.RepeatedSequenceExpression_count = Slot(uri=GA4GH_VRS_DEFINITIONS.count, name="RepeatedSequenceExpression_count", curie=GA4GH_VRS_DEFINITIONS.curie('count'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.RepeatedSequenceExpression_count, domain=RepeatedSequenceExpression, range=str)
+
+slots.Gene_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="Gene_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Gene_type, domain=Gene, range=Union[str, "TypeOptions"])
+
+slots.Gene_gene_id = Slot(uri=GA4GH_VRS_DEFINITIONS.gene_id, name="Gene_gene_id", curie=GA4GH_VRS_DEFINITIONS.curie('gene_id'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Gene_gene_id, domain=Gene, range=Union[dict, "CURIE"])
+
+slots.Number_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="Number_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Number_type, domain=Number, range=Union[str, "TypeOptions"])
+
+slots.Number_value = Slot(uri=GA4GH_VRS_DEFINITIONS.value, name="Number_value", curie=GA4GH_VRS_DEFINITIONS.curie('value'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.Number_value, domain=Number, range=float)
+
+slots.IndefiniteRange_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="IndefiniteRange_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.IndefiniteRange_type, domain=IndefiniteRange, range=Union[str, "TypeOptions"])
+
+slots.IndefiniteRange_value = Slot(uri=GA4GH_VRS_DEFINITIONS.value, name="IndefiniteRange_value", curie=GA4GH_VRS_DEFINITIONS.curie('value'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.IndefiniteRange_value, domain=IndefiniteRange, range=float)
+
+slots.IndefiniteRange_comparator = Slot(uri=GA4GH_VRS_DEFINITIONS.comparator, name="IndefiniteRange_comparator", curie=GA4GH_VRS_DEFINITIONS.curie('comparator'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.IndefiniteRange_comparator, domain=IndefiniteRange, range=Union[str, "ComparatorOptions"])
+
+slots.DefiniteRange_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="DefiniteRange_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DefiniteRange_type, domain=DefiniteRange, range=Union[str, "TypeOptions"])
+
+slots.DefiniteRange_min = Slot(uri=GA4GH_VRS_DEFINITIONS.min, name="DefiniteRange_min", curie=GA4GH_VRS_DEFINITIONS.curie('min'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DefiniteRange_min, domain=DefiniteRange, range=float)
+
+slots.DefiniteRange_max = Slot(uri=GA4GH_VRS_DEFINITIONS.max, name="DefiniteRange_max", curie=GA4GH_VRS_DEFINITIONS.curie('max'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.DefiniteRange_max, domain=DefiniteRange, range=float)
+
+slots.SequenceState_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="SequenceState_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceState_type, domain=SequenceState, range=Union[str, "TypeOptions"])
+
+slots.SequenceState_sequence = Slot(uri=GA4GH_VRS_DEFINITIONS.sequence, name="SequenceState_sequence", curie=GA4GH_VRS_DEFINITIONS.curie('sequence'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SequenceState_sequence, domain=SequenceState, range=Union[dict, Sequence])
+
+slots.SimpleInterval_type = Slot(uri=GA4GH_VRS_DEFINITIONS.type, name="SimpleInterval_type", curie=GA4GH_VRS_DEFINITIONS.curie('type'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SimpleInterval_type, domain=SimpleInterval, range=Union[str, "TypeOptions"])
+
+slots.SimpleInterval_start = Slot(uri=GA4GH_VRS_DEFINITIONS.start, name="SimpleInterval_start", curie=GA4GH_VRS_DEFINITIONS.curie('start'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SimpleInterval_start, domain=SimpleInterval, range=int)
+
+slots.SimpleInterval_end = Slot(uri=GA4GH_VRS_DEFINITIONS.end, name="SimpleInterval_end", curie=GA4GH_VRS_DEFINITIONS.curie('end'),
+                   model_uri=GA4GH_VRS_DEFINITIONS.SimpleInterval_end, domain=SimpleInterval, range=int)
\ No newline at end of file
@@ -16,6 +16,7 @@ from tests import INPUT_DIR, OUTPUT_DIR
 
 REPRO = os.path.join(INPUT_DIR, 'reproschema.ttl')
 OUTSCHEMA = os.path.join(OUTPUT_DIR, 'reproschema-from-ttl.yaml')
+RDFS_DIR = os.path.join(INPUT_DIR, 'rdfs')
 
 
 
@@ -33,10 +34,79 @@ def test_from_rdfs():
     assert activity.name == "Activity"
     assert activity.is_a == "CreativeWork"
     slots = sv.class_induced_slots(activity.name)
-    assert len(slots) == 1
-    slot = slots[0]
-    assert slot.name == "id"
+    assert len(slots) == 18
+    slot_names = [slot.name for slot in slots]
+    assert "id" in slot_names
+    assert "citation" in slot_names
 
 
+def test_from_rdfs_implicit_properties():
+    """Test properties declared via schema:domainIncludes/rangeIncludes."""
+    oie = RdfsImportEngine()
+    schema = oie.convert(REPRO, default_prefix='reproschema')
+    # declared only via schema:domainIncludes, without an rdf:type
+    citation = schema.slots["citation"]
+    assert citation.slot_uri == "schema1:citation"
+    assert "citation" in schema.classes["Activity"].slots
+    is_part_of = schema.slots["isPartOf"]
+    assert is_part_of.range == "Activity"
+    assert "isPartOf" in schema.classes["Field"].slots
+
+
+def _convert_example(filename, **kwargs):
+    """Converts one of the small example graphs in the rdfs resources directory."""
+    oie = RdfsImportEngine(initial_metamodel_mappings=kwargs.pop('initial_metamodel_mappings', None))
+    return oie.convert(os.path.join(RDFS_DIR, filename), default_prefix='ex',
+                       model_uri='http://example.org/', **kwargs)
+
+
+def test_from_rdfs_string_metamodel_mappings():
+    """Test metamodel mappings given as plain strings, as loaded from YAML."""
+    schema = _convert_example('string-mappings.ttl',
+                              initial_metamodel_mappings={"ClassDefinition": "http://example.org/Concept"})
+    assert "Person" in schema.classes
+
+
+def test_from_rdfs_duplicate_domains():
+    """Test a property whose domain is declared more than once."""
+    schema = _convert_example('duplicate-domains.ttl')
+    assert schema.classes["Person"].slots == ["age", "name"]
+
+
+def test_from_rdfs_multiple_ranges():
+    """Test a property with more than one range."""
+    schema = _convert_example('multiple-ranges.ttl')
+    funder = schema.slots["funder"]
+    assert funder.range is None
+    assert sorted(x.range for x in funder.any_of) == ["Organization", "Person"]
+    lead = schema.slots["lead"]
+    assert lead.range == "Person"
+    assert not lead.any_of
+
+
+def test_from_rdfs_n3_formulas():
+    """Test that triples inside N3 quoted formulas are not imported."""
+    schema = _convert_example('formulas.n3', format='n3')
+    assert list(schema.classes) == ["Person"]
+    assert "hidden" not in schema.slots
+
+
+def test_from_rdfs_subproperty():
+    """Test that slot-valued metaslots of properties do not dangle."""
+    schema = _convert_example('subproperty.ttl')
+    outschema = os.path.join(OUTPUT_DIR, 'subproperty-from-ttl.yaml')
+    write_schema(schema, outschema)
+    YAMLGenerator(outschema).serialize()
+    knows = schema.slots["knows"]
+    assert knows.subproperty_of is None
+    assert knows.inverse is None
 
 
+def test_from_rdfs_typed_literals():
+    """Test that literals are converted to Python values."""
+    schema = _convert_example('typed-literals.ttl')
+    person = schema.classes["Person"]
+    assert person.rank == 2
+    assert type(person.rank) is int
+    assert person.abstract is True
+    assert type(person.comments[0]) is str